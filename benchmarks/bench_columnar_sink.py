@@ -0,0 +1,73 @@
+"""
+Benchmark sink penyimpanan: CSV vs Parquet vs Feather (Arrow IPC).
+
+Data mentah sintetis ditransformasi lebih dulu, lalu setiap format diukur
+waktu tulis, waktu baca penuh, waktu baca satu kolom (Price_in_rupiah),
+dan ukuran file. Membutuhkan pyarrow.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_columnar_sink [jumlah_baris]
+"""
+import os
+import sys
+import time
+import tempfile
+import importlib.util
+import pandas as pd
+from benchmarks.fixtures import build_raw_frame
+from utils.transform import transform_data
+from utils.load import save_to_csv, save_to_parquet
+
+# (label, format, kompresi); format None berarti CSV
+SINKS = [
+    ("csv", None, None),
+    ("parquet-snappy", "parquet", "snappy"),
+    ("parquet-zstd", "parquet", "zstd"),
+    ("feather-lz4", "feather", "lz4"),
+    ("feather-zstd", "feather", "zstd"),
+]
+
+def read_file(file_path, file_format, columns=None):
+    if file_format is None:
+        return pd.read_csv(file_path, usecols=columns)
+    if file_format == "parquet":
+        return pd.read_parquet(file_path, columns=columns)
+    return pd.read_feather(file_path, columns=columns)
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def main(rows=1_000_000):
+    if importlib.util.find_spec("pyarrow") is None:
+        print("pyarrow tidak terpasang, jalankan: pip install pyarrow")
+        return
+    
+    df = transform_data(build_raw_frame(rows))
+    print(f"Data hasil transformasi: {len(df)} baris")
+    print(f"{'sink':<16} {'tulis':>8} {'baca':>8} {'1 kolom':>8} {'ukuran':>10}")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label, file_format, compression in SINKS:
+            file_path = os.path.join(tmp_dir, f"{label}.{file_format or 'csv'}")
+            
+            if file_format is None:
+                ok, write_time = timed(save_to_csv, df, file_path)
+            else:
+                ok, write_time = timed(
+                    save_to_parquet, df, file_path, file_format=file_format, compression=compression
+                )
+            if not ok:
+                print(f"{label:<16} gagal")
+                continue
+            
+            _, read_time = timed(read_file, file_path, file_format)
+            _, column_time = timed(read_file, file_path, file_format, ["Price_in_rupiah"])
+            size_mb = os.path.getsize(file_path) / 1024 / 1024
+            print(
+                f"{label:<16} {write_time:7.2f}s {read_time:7.2f}s {column_time:7.2f}s {size_mb:8.1f}MB"
+            )
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,103 @@
+"""
+Benchmark memori penampung hasil ekstraksi: list dict vs buffer per kolom.
+
+Nilai kartu (judul, harga, field teks) disiapkan lebih dulu untuk 100.000
+kartu sintetis, sehingga yang diukur dengan tracemalloc hanya penampungnya:
+jumlah blok alokasi dan byte yang tertahan setelah semua kartu ditambahkan,
+serta puncak memori saat diubah menjadi DataFrame.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_extract_records [jumlah_kartu]
+"""
+import sys
+import time
+import tracemalloc
+import pandas as pd
+from benchmarks.fixtures import build_raw_frame
+from utils.extract import ProductRecords, ProductColumns, _now_timestamp
+
+# Jumlah kartu per halaman katalog
+CARDS_PER_PAGE = 20
+
+def build_card_parts(card_count):
+    """Membuat tuple (judul, harga, field) per kartu dari fixture mentah."""
+    raw_df = build_raw_frame(card_count)
+    return [
+        (title, price, {"Rating": rating, "Colors": colors, "Size": size, "Gender": gender})
+        for title, price, rating, colors, size, gender in zip(
+            raw_df["Title"], raw_df["Price"], raw_df["Rating"],
+            raw_df["Colors"], raw_df["Size"], raw_df["Gender"]
+        )
+    ]
+
+def dicts_per_card_timestamp(card_parts):
+    """Perilaku lama: dict 7 kunci dan timestamp baru untuk setiap kartu."""
+    return [
+        {"Title": title, "Price": price, **fields, "timestamp": _now_timestamp()}
+        for title, price, fields in card_parts
+    ]
+
+def dicts_per_page_timestamp(card_parts):
+    products = []
+    for start in range(0, len(card_parts), CARDS_PER_PAGE):
+        timestamp = _now_timestamp()
+        products.extend(
+            {"Title": title, "Price": price, **fields, "timestamp": timestamp}
+            for title, price, fields in card_parts[start:start + CARDS_PER_PAGE]
+        )
+    return products
+
+def fill_buffer(buffer_class):
+    def fill(card_parts):
+        buffer = buffer_class()
+        for start in range(0, len(card_parts), CARDS_PER_PAGE):
+            timestamp = _now_timestamp()
+            for title, price, fields in card_parts[start:start + CARDS_PER_PAGE]:
+                buffer.append(title, price, fields, timestamp)
+        return buffer
+    return fill
+
+def to_frame(container):
+    if isinstance(container, list):
+        return pd.DataFrame(container)
+    return container.to_frame()
+
+def measure(fill, card_parts):
+    tracemalloc.start()
+    start = time.perf_counter()
+    container = fill(card_parts)
+    fill_seconds = time.perf_counter() - start
+    
+    snapshot = tracemalloc.take_snapshot()
+    stats = snapshot.statistics("filename")
+    blocks = sum(stat.count for stat in stats)
+    retained = sum(stat.size for stat in stats)
+    
+    tracemalloc.reset_peak()
+    frame = to_frame(container)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    del frame, container
+    return fill_seconds, blocks, retained, peak
+
+def main(card_count=100_000):
+    card_parts = build_card_parts(card_count)
+    print(f"Kartu sintetis: {card_count}, {CARDS_PER_PAGE} kartu per halaman")
+    print(f"{'penampung':<28} {'waktu':>7} {'blok':>10} {'tertahan':>10} {'puncak DataFrame':>17}")
+    
+    modes = {
+        "list dict (ts per kartu)": dicts_per_card_timestamp,
+        "list dict (ts per halaman)": dicts_per_page_timestamp,
+        "ProductRecords": fill_buffer(ProductRecords),
+        "ProductColumns (bertipe)": fill_buffer(ProductColumns),
+    }
+    for name, fill in modes.items():
+        seconds, blocks, retained, peak = measure(fill, card_parts)
+        print(
+            f"{name:<28} {seconds:6.2f}s {blocks:>10} "
+            f"{retained / 1024 / 1024:8.1f}MB {peak / 1024 / 1024:15.1f}MB"
+        )
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,51 @@
+"""
+Benchmark backend parser HTML untuk ekstraksi kartu produk.
+
+Menjalankan parse_product_page pada fixture sintetis berisi 10.000 kartu
+produk dengan setiap backend yang terpasang.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_parser
+"""
+import time
+from utils.extract import available_parsers, parse_product_page
+
+CARD_COUNT = 10_000
+
+def build_fixture(card_count=CARD_COUNT):
+    """Membuat HTML sintetis dengan sejumlah kartu produk."""
+    cards = "".join(
+        f"""
+        <div class="collection-card">
+            <div class="product-details">
+                <h3 class="product-title">Product {i}</h3>
+                <div class="price-container"><span class="price">${i % 500}.99</span></div>
+                <p style="font-size: 14px; color: #777;">Rating: ⭐ {i % 5}.{i % 10} / 5</p>
+                <p style="font-size: 14px; color: #777;">{i % 8} Colors</p>
+                <p style="font-size: 14px; color: #777;">Size: {"SMLX"[i % 4]}</p>
+                <p style="font-size: 14px; color: #777;">Gender: {("Men", "Women", "Unisex")[i % 3]}</p>
+            </div>
+        </div>
+        """
+        for i in range(card_count)
+    )
+    return f"<html><body><div class='collection-grid'>{cards}</div></body></html>".encode()
+
+def main():
+    content = build_fixture()
+    print(f"Fixture: {CARD_COUNT} kartu, {len(content) / 1024 / 1024:.1f} MB")
+    
+    baseline = None
+    for parser in available_parsers():
+        start = time.perf_counter()
+        card_count, products = parse_product_page(content, parser)
+        elapsed = time.perf_counter() - start
+        
+        baseline = baseline or elapsed
+        print(
+            f"{parser:<12} {elapsed:8.3f}s  {card_count} kartu  "
+            f"{baseline / elapsed:5.1f}x dibanding html.parser"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Benchmark engine transform_data: regex per baris vs operasi vectorized.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_transform [jumlah_baris]
+"""
+import sys
+import time
+import pandas as pd
+from benchmarks.fixtures import build_raw_frame
+from utils.transform import transform_data, TRANSFORM_ENGINES
+
+def main(rows=1_000_000):
+    raw_df = build_raw_frame(rows)
+    print(f"Data mentah: {rows} baris")
+    
+    results = {}
+    for engine in TRANSFORM_ENGINES:
+        start = time.perf_counter()
+        results[engine] = transform_data(raw_df, engine=engine)
+        elapsed = time.perf_counter() - start
+        print(f"{engine:<12} {elapsed:8.2f}s")
+    
+    pd.testing.assert_frame_equal(results["python"], results["vectorized"])
+    print("Hasil kedua engine identik")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
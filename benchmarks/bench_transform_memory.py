@@ -0,0 +1,60 @@
+"""
+Benchmark memori transform_data: salinan per langkah vs satu salinan.
+
+Setiap mode dijalankan di proses terpisah. Setelah data mentah dimuat,
+penanda peak RSS (VmHWM) di-reset lewat /proc/self/clear_refs sehingga
+angka yang dilaporkan hanya mencerminkan transformasi (khusus Linux).
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_transform_memory [jumlah_baris]
+"""
+import gc
+import os
+import sys
+import tempfile
+import multiprocessing
+from benchmarks.fixtures import build_raw_frame
+
+def _memory_status_mb(field):
+    """Membaca VmRSS/VmHWM dari /proc/self/status dalam MB."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+def _reset_peak_rss():
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+
+def _run(pickle_path, single_copy, queue):
+    import pandas as pd
+    from utils.transform import transform_data
+    
+    raw_df = pd.read_pickle(pickle_path)
+    gc.collect()
+    _reset_peak_rss()
+    before = _memory_status_mb("VmRSS")
+    transform_data(raw_df, engine="vectorized", single_copy=single_copy)
+    queue.put((before, _memory_status_mb("VmHWM")))
+
+def main(rows=1_000_000):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pickle_path = os.path.join(temp_dir, "raw.pkl")
+        build_raw_frame(rows).to_pickle(pickle_path)
+        print(f"Data mentah: {rows} baris")
+        
+        context = multiprocessing.get_context("spawn")
+        for label, single_copy in (("salinan per langkah", False), ("satu salinan", True)):
+            queue = context.Queue()
+            process = context.Process(target=_run, args=(pickle_path, single_copy, queue))
+            process.start()
+            before, after = queue.get()
+            process.join()
+            print(
+                f"{label:<20} peak RSS {after:8.1f} MB  "
+                f"(+{after - before:.1f} MB di atas data mentah)"
+            )
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,39 @@
+"""
+Benchmark transformasi paralel transform_data dengan 1/2/4/8 worker.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_transform_parallel [jumlah_baris]
+"""
+import os
+import sys
+import time
+import contextlib
+import io
+import pandas as pd
+from benchmarks.fixtures import build_raw_frame
+from utils.transform import transform_data
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+def main(rows=1_000_000):
+    raw_df = build_raw_frame(rows)
+    print(f"Data mentah: {rows} baris, CPU tersedia: {os.cpu_count()}")
+    
+    baseline = None
+    expected = None
+    for workers in WORKER_COUNTS:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = transform_data(raw_df, engine="vectorized", schema="compact", workers=workers)
+        elapsed = time.perf_counter() - start
+        
+        if baseline is None:
+            baseline, expected = elapsed, result
+        else:
+            pd.testing.assert_frame_equal(result, expected)
+        print(f"{workers} worker  {elapsed:8.2f}s  speedup {baseline / elapsed:5.2f}x")
+    
+    print("Hasil semua jumlah worker identik")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,38 @@
+"""Data sintetis untuk benchmark transformasi dan penyimpanan."""
+import numpy as np
+import pandas as pd
+
+def build_raw_frame(rows, seed=0):
+    """
+    Membuat DataFrame mentah dengan format yang sama seperti hasil ekstraksi.
+    
+    Sekitar 5% baris dibuat tidak valid (Unknown Product, harga/rating
+    tidak tersedia) agar langkah remove_invalid_data ikut bekerja.
+    
+    Args:
+        rows (int): Jumlah baris
+        seed (int): Seed random generator
+        
+    Returns:
+        pd.DataFrame: DataFrame mentah
+    """
+    rng = np.random.default_rng(seed)
+    product_ids = rng.integers(0, rows, rows)
+    invalid = rng.random(rows) < 0.05
+    
+    titles = np.where(invalid, "Unknown Product", np.char.add("Product ", product_ids.astype(str)))
+    prices = np.char.add("$", np.round(rng.uniform(5, 500, rows), 2).astype(str))
+    ratings = np.char.add(np.char.add("Rating: ⭐ ", np.round(rng.uniform(1, 5, rows), 1).astype(str)), " / 5")
+    colors = np.char.add(np.char.add("Colors: ", rng.integers(1, 8, rows).astype(str)), " Colors")
+    sizes = np.char.add("Size: ", rng.choice(["S", "M", "L", "XL", "XXL"], rows))
+    genders = np.char.add("Gender: ", rng.choice(["Men", "Women", "Unisex"], rows))
+    
+    return pd.DataFrame({
+        "Title": titles.astype(object),
+        "Price": np.where(invalid, "Price Unavailable", prices).astype(object),
+        "Rating": np.where(invalid, "Invalid Rating", ratings).astype(object),
+        "Colors": colors.astype(object),
+        "Size": sizes.astype(object),
+        "Gender": genders.astype(object),
+        "timestamp": "2025-05-08 08:37:46",
+    })
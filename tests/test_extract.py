@@ -1,10 +1,141 @@
+import os
+import re
+import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, MagicMock
 import pandas as pd
-from utils.extract import fetching_content, extract_product_data, scrape_fashion_products, main
+from utils.extract import (
+    fetching_content, extract_product_data, scrape_fashion_products, main,
+    RateLimiter, create_session, close_session, PageCache, PageIndex,
+    available_parsers, resolve_parser, parse_product_page, iter_product_batches,
+    UrlFrontier, crawl_catalogues, discover_page_count, ProductColumns, ProductRecords
+)
+
+def build_catalog_page(page_number, cards_per_page=3, site="", pagination=None, total_pages=0):
+    """Membuat HTML satu halaman katalog untuk server lokal."""
+    cards = "".join(
+        f"""
+        <div class="collection-card">
+            <h3 class="product-title">Product {site}{page_number}-{i}</h3>
+            <span class="price">${10 + i}.00</span>
+            <p>Rating: 4.{i} / 5</p>
+            <p>Colors: 3 Colors</p>
+            <p>Size: M</p>
+            <p>Gender: Men</p>
+        </div>
+        """
+        for i in range(cards_per_page)
+    )
+    if pagination == "links":
+        cards += "".join(f'<a href="/page{page}">{page}</a>' for page in range(2, total_pages + 1))
+    elif pagination == "next" and page_number < total_pages:
+        cards += f'<a href="/page{page_number + 1}">Next &rarr;</a>'
+
+    elif pagination == "text":
+        cards += f"<span>Page {page_number} of {total_pages}</span>"
+    return f"<html><body>{cards}</body></html>".encode()
+
+class CatalogServer:
+    """
+    Server HTTP lokal pengganti fashion-studio untuk pengujian.
+    
+    Halaman 1 tersedia di "/", halaman berikutnya di "/pageN". Halaman di
+    atas total_pages menghasilkan 404. Sebanyak `failures` request pertama
+    dijawab 503 dengan header Retry-After. Setiap halaman memiliki ETag
+    yang berubah ketika `version` dinaikkan. Katalog tambahan dapat dilayani
+    di bawah prefix path melalui `sites`, misalnya {"/shopa": 4}. Opsi
+    `pagination` ("links", "next" atau "text") menambahkan navigasi halaman.
+    """
+    
+    def __init__(self, total_pages=5, latency=0.0, failures=0, retry_after=0, sites=None,
+                 pagination=None):
+        self.total_pages = total_pages
+        self.pagination = pagination
+        self.sites = {"": total_pages, **(sites or {})}
+        self.latency = latency
+        self.failures = failures
+        self.retry_after = retry_after
+        self.version = 1
+        self.cards_per_page = 3
+        self.requested_paths = []
+        self.conditional_requests = 0
+        self.client_ports = set()
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Aktifkan keep-alive
+            
+            def do_GET(self):
+                server.requested_paths.append(self.path)
+                server.client_ports.add(self.client_address[1])
+                time.sleep(server.latency)
+                
+                if server.failures > 0:
+                    server.failures -= 1
+                    self.send_response(503)
+                    self.send_header("Retry-After", str(server.retry_after))
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                
+                match = re.fullmatch(r"(/[a-z]+)?(?:/page(\d+))?/?", self.path)
+                site = match.group(1) or "" if match else None
+                page_number = int(match.group(2) or 1) if match else 0
+                
+                if site not in server.sites or not 1 <= page_number <= server.sites[site]:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                
+                etag = f'"page{page_number}-v{server.version}"'
+                if self.headers.get("If-None-Match"):
+                    server.conditional_requests += 1
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                
+                body = build_catalog_page(
+                    page_number, server.cards_per_page, site.strip("/"),
+                    server.pagination, server.sites[site]
+                )
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", "Mon, 01 Jan 2024 00:00:00 GMT")
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+    
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+    
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
 
 class TestExtract(unittest.TestCase):
     
+    def setUp(self):
+        """Pastikan setiap test memakai session bersama yang baru"""
+        close_session()
+    
+    def tearDown(self):
+        close_session()
+    
     def test_fetching_content_success(self):
         """Test fetching_content saat berhasil"""
         with patch('requests.Session') as mock_session:
@@ -147,5 +278,532 @@ class TestExtract(unittest.TestCase):
         self.assertIsNone(result)
         mock_scrape.assert_called_once()
 
+class TestParserBackends(unittest.TestCase):
+    
+    def test_extract_product_data_defaults(self):
+        """Test nilai default ketika paragraf rating/warna/ukuran/gender tidak ada"""
+        from bs4 import BeautifulSoup
+        html = '<div class="collection-card"><h3 class="product-title">X</h3><p>Other</p></div>'
+        card = BeautifulSoup(html, 'html.parser').find('div', class_='collection-card')
+        
+        result = extract_product_data(card)
+        
+        # Verifikasi
+        self.assertEqual(result['Price'], 'Price Unavailable')
+        self.assertEqual(result['Rating'], 'Invalid Rating')
+        self.assertEqual(result['Colors'], '3 Colors')
+        self.assertEqual(result['Size'], 'Size: M')
+        self.assertEqual(result['Gender'], 'Gender: Unisex')
+    
+    def test_extract_product_data_first_match_wins(self):
+        """Test paragraf pertama yang mengandung label dipakai untuk field tersebut"""
+        from bs4 import BeautifulSoup
+        html = """
+        <div class="collection-card">
+            <p>Size: S Gender: Women</p>
+            <p>Size: XL</p>
+            <p>Rating: ⭐ 4.8 / 5</p>
+        </div>
+        """
+        card = BeautifulSoup(html, 'html.parser').find('div', class_='collection-card')
+        
+        result = extract_product_data(card)
+        
+        # Verifikasi
+        self.assertEqual(result['Size'], 'Size: S Gender: Women')
+        self.assertEqual(result['Gender'], 'Size: S Gender: Women')
+        self.assertEqual(result['Rating'], 'Rating: ⭐ 4.8 / 5')
+    
+    def test_backends_produce_same_products(self):
+        """Test semua backend yang terpasang menghasilkan data yang sama"""
+        content = build_catalog_page(1, cards_per_page=5)
+        
+        results = {}
+        for parser in available_parsers():
+            card_count, products = parse_product_page(content, parser)
+            self.assertEqual(card_count, 5)
+            results[parser] = [{k: v for k, v in p.items() if k != 'timestamp'} for p in products]
+        
+        # Verifikasi
+        for parser, products in results.items():
+            self.assertEqual(products, results['html.parser'], parser)
+    
+    def test_backends_same_products_nested_markup(self):
+        """Test semua backend memperlakukan <p> dengan markup bersarang seperti p.string"""
+        content = """
+        <div class="collection-card">
+            <h3 class="product-title">T-Shirt</h3>
+            <span class="price">$100.00</span>
+            <p><span>Rating: ⭐ 4.8 / 5</span></p>
+            <p>Colors: <b>3</b> Colors</p>
+            <p>Size: M</p>
+            <p><span>Gender: </span>Men</p>
+        </div>
+        """
+        
+        results = {}
+        for parser in available_parsers():
+            _, products = parse_product_page(content, parser)
+            results[parser] = [{k: v for k, v in p.items() if k != 'timestamp'} for p in products]
+        
+        # Verifikasi
+        self.assertEqual(results['html.parser'][0]['Rating'], 'Rating: ⭐ 4.8 / 5')
+        for parser, products in results.items():
+            self.assertEqual(products, results['html.parser'], parser)
+    
+    def test_typed_parse_matches_string_parse(self):
+        """Test jalur bertipe menghasilkan nilai yang sudah bersih dari data yang sama"""
+        content = build_catalog_page(1, cards_per_page=3) + (
+            b'<div class="collection-card"><h3 class="product-title">X</h3>'
+            b'<span class="price">Price Unavailable</span></div>'
+        )
+        
+        for parser in available_parsers():
+            card_count, columns = parse_product_page(content, parser, typed=True)
+            df = columns.to_frame()
+            
+            # Verifikasi
+            self.assertEqual(card_count, 4)
+            self.assertIsInstance(columns, ProductColumns)
+            self.assertEqual(df['Title'].tolist(), ['Product 1-0', 'Product 1-1', 'Product 1-2', 'X'])
+            self.assertEqual(df['Price'].tolist()[:3], [10.0, 11.0, 12.0])
+            self.assertTrue(pd.isna(df.loc[3, 'Price']))
+            self.assertEqual(df['Rating'].tolist()[:3], [4.0, 4.1, 4.2])
+            self.assertTrue(pd.isna(df.loc[3, 'Rating']))
+            self.assertEqual(df['Colors'].tolist(), [3.0] * 4)
+            self.assertEqual(df['Size'].tolist(), ['M', 'M', 'M', 'M'])
+            self.assertEqual(df['Gender'].tolist(), ['Men', 'Men', 'Men', 'Unisex'])
+    
+    def test_columnar_parse_matches_dict_parse(self):
+        """Test buffer per kolom menghasilkan DataFrame yang sama dengan list dict"""
+        content = build_catalog_page(1, cards_per_page=4)
+        
+        for parser in available_parsers():
+            _, products = parse_product_page(content, parser)
+            _, records = parse_product_page(content, parser, columnar=True)
+            
+            # Verifikasi
+            self.assertIsInstance(records, ProductRecords)
+            pd.testing.assert_frame_equal(records.to_frame(), pd.DataFrame(products))
+    
+    def test_timestamp_computed_once_per_page(self):
+        """Test timestamp dibuat sekali per halaman untuk semua kartu"""
+        content = build_catalog_page(1, cards_per_page=5)
+        
+        for columnar in (False, True):
+            with patch('utils.extract._now_timestamp', return_value='2023-06-01 12:00:00') as mock_now:
+                _, products = parse_product_page(content, 'html.parser', columnar=columnar)
+            
+            # Verifikasi
+            mock_now.assert_called_once()
+            self.assertEqual(len(products), 5)
+    
+    def test_resolve_parser(self):
+        """Test pemilihan backend parser"""
+        self.assertEqual(resolve_parser('html.parser'), 'html.parser')
+        self.assertEqual(resolve_parser('auto'), available_parsers()[-1])
+        with self.assertRaises(ValueError):
+            resolve_parser('unknown')
+
+class TestConcurrentScrape(unittest.TestCase):
+    
+    def test_concurrent_preserves_page_order(self):
+        """Test mode konkuren menghasilkan urutan yang sama dengan mode sekuensial"""
+        with CatalogServer(total_pages=6, latency=0.02) as server:
+            sequential = scrape_fashion_products(server.base_url, max_pages=6, delay=0)
+            concurrent = scrape_fashion_products(server.base_url, max_pages=6, concurrency=4)
+        
+        # Verifikasi
+        self.assertEqual(len(concurrent), 18)
+        self.assertEqual(
+            [product['Title'] for product in concurrent],
+            [product['Title'] for product in sequential]
+        )
+    
+    def test_concurrent_stops_at_first_missing_page(self):
+        """Test mode konkuren berhenti di halaman pertama yang gagal"""
+        with CatalogServer(total_pages=3) as server:
+            result = scrape_fashion_products(server.base_url, max_pages=20, concurrency=4)
+            requested = len(server.requested_paths)
+        
+        # Verifikasi
+        self.assertEqual(len(result), 9)
+        self.assertEqual(result[-1]['Title'], 'Product 3-2')
+        self.assertLess(requested, 20)  # Halaman setelah akhir katalog tidak semuanya diambil
+    
+    def test_concurrent_speedup(self):
+        """Test mode konkuren lebih cepat dibanding mode sekuensial"""
+        with CatalogServer(total_pages=10, latency=0.1) as server:
+            start = time.perf_counter()
+            scrape_fashion_products(server.base_url, max_pages=10, delay=0)
+            sequential_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            scrape_fashion_products(server.base_url, max_pages=10, concurrency=5)
+            concurrent_time = time.perf_counter() - start
+        
+        # Verifikasi - 10 halaman x 0.1s latensi minimal 1 detik jika sekuensial
+        self.assertGreaterEqual(sequential_time, 1.0)
+        self.assertLess(concurrent_time, sequential_time / 2)
+    
+    def test_rate_limiter(self):
+        """Test RateLimiter membatasi jumlah request per detik"""
+        limiter = RateLimiter(requests_per_second=20)
+        
+        start = time.perf_counter()
+        for _ in range(5):
+            limiter.wait()
+        elapsed = time.perf_counter() - start
+        
+        # Verifikasi - 5 request pada 20 rps membutuhkan minimal 4 interval
+        self.assertGreaterEqual(elapsed, 0.19)
+
+class TestStreaming(unittest.TestCase):
+    
+    def test_iter_product_batches_yields_pages(self):
+        """Test generator menghasilkan satu batch per halaman sesuai urutan"""
+        with CatalogServer(total_pages=4) as server:
+            batches = list(iter_product_batches(server.base_url, max_pages=10, concurrency=3))
+        
+        # Verifikasi
+        self.assertEqual(len(batches), 4)
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 3, 3])
+        self.assertEqual([batch[0]['Title'] for batch in batches],
+                         ['Product 1-0', 'Product 2-0', 'Product 3-0', 'Product 4-0'])
+    
+    def test_iter_product_batches_stops_early(self):
+        """Test konsumen dapat berhenti sebelum crawl selesai"""
+        with CatalogServer(total_pages=10) as server:
+            batches = iter_product_batches(server.base_url, max_pages=10, delay=0)
+            first = next(batches)
+            batches.close()
+            requested = len(server.requested_paths)
+        
+        # Verifikasi
+        self.assertEqual(len(first), 3)
+        self.assertEqual(requested, 1)
+
+class TestMultiProcessCrawl(unittest.TestCase):
+    
+    def test_frontier_politeness(self):
+        """Test frontier membatasi request berjalan dan jarak request per host"""
+        frontier = UrlFrontier(max_in_flight=2, min_interval=1.0)
+        for page in range(1, 4):
+            frontier.add(('a', page), f"http://a.test/page{page}")
+        frontier.add(('b', 1), "http://b.test/")
+        
+        # Verifikasi - host bergiliran dan jarak antar request dihormati
+        self.assertEqual(frontier.pop_ready(now=100.0)[0], ('a', 1))
+        self.assertEqual(frontier.pop_ready(now=100.0)[0], ('b', 1))
+        self.assertIsNone(frontier.pop_ready(now=100.5))
+        self.assertEqual(frontier.wait_time(now=100.5), 0.5)
+        self.assertEqual(frontier.pop_ready(now=101.0)[0], ('a', 2))
+        
+        # Verifikasi - batas request berjalan per host
+        self.assertIsNone(frontier.pop_ready(now=102.0))
+        self.assertIsNone(frontier.wait_time(now=102.0))
+        frontier.done("http://a.test/page1")
+        self.assertEqual(frontier.pop_ready(now=102.0)[0], ('a', 3))
+        self.assertEqual(len(frontier), 0)
+    
+    def test_crawl_catalogues_merges_deterministically(self):
+        """Test crawl multi-katalog dengan proses worker"""
+        with CatalogServer(total_pages=1, sites={"/shopa": 5, "/shopb": 3}) as server:
+            base_urls = [f"{server.base_url}/shopa", f"{server.base_url}/shopb"]
+            result = crawl_catalogues(
+                base_urls, max_pages=8, processes=2, max_in_flight_per_host=3, host_interval=0
+            )
+            expected = []
+            for base_url in base_urls:
+                expected.extend(scrape_fashion_products(base_url, max_pages=8, delay=0))
+        
+        # Verifikasi
+        self.assertEqual(len(result), 24)
+        self.assertEqual([p['Title'] for p in result], [p['Title'] for p in expected])
+        self.assertEqual(result[0]['Title'], 'Product shopa1-0')
+        self.assertEqual(result[-1]['Title'], 'Product shopb3-2')
+
+class TestPageDiscovery(unittest.TestCase):
+    
+    def test_discover_from_pagination_links(self):
+        """Test jumlah halaman dibaca dari link pagination halaman 1"""
+        with CatalogServer(total_pages=7, pagination="links") as server:
+            page_count = discover_page_count(server.base_url, max_pages=50)
+            requested = len(server.requested_paths)
+        
+        # Verifikasi - halaman 1 dan satu probe /page8 untuk konfirmasi
+        self.assertEqual(page_count, 7)
+        self.assertEqual(requested, 2)
+    
+    def test_discover_next_only_paginator(self):
+        """Test paginator "Next" yang hanya menautkan /page2 tidak memotong crawl"""
+        for total_pages in (2, 20):
+            with CatalogServer(total_pages=total_pages, pagination="next") as server:
+                page_count = discover_page_count(server.base_url, max_pages=50)
+                requested = len(server.requested_paths)
+            
+            # Verifikasi
+            self.assertEqual(page_count, total_pages)
+            self.assertLessEqual(requested, 14)
+    
+    def test_discover_reuses_page_one_through_cache(self):
+        """Test halaman 1 dari discovery disimpan di cache sehingga crawl cukup conditional GET"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = PageCache(cache_dir)
+            with CatalogServer(total_pages=3, pagination="links") as server:
+                result = scrape_fashion_products(
+                    server.base_url, max_pages=50, discover_pages=True, cache=cache, delay=0
+                )
+                conditional = server.conditional_requests
+        
+        # Verifikasi
+        self.assertEqual(len(result), 9)
+        self.assertEqual(conditional, 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+    
+    def test_discover_from_page_text(self):
+        """Test jumlah halaman dibaca dari teks "Page X of N" dan dibatasi max_pages"""
+        with CatalogServer(total_pages=30, pagination="text") as server:
+            self.assertEqual(discover_page_count(server.base_url, max_pages=50), 30)
+            self.assertEqual(discover_page_count(server.base_url, max_pages=20), 20)
+    
+    def test_discover_by_probing(self):
+        """Test exponential dan binary probing tanpa pagination"""
+        for total_pages in (1, 2, 13, 16, 50):
+            with CatalogServer(total_pages=total_pages) as server:
+                page_count = discover_page_count(server.base_url, max_pages=50)
+                requested = len(server.requested_paths)
+            
+            # Verifikasi - jumlah request logaritmik terhadap jumlah halaman
+            self.assertEqual(page_count, total_pages)
+            self.assertLessEqual(requested, 14)
+    
+    def test_scrape_with_discovery_avoids_missing_pages(self):
+        """Test crawl dengan discovery tidak me-request halaman yang tidak ada"""
+        with CatalogServer(total_pages=6, pagination="links") as server:
+            result = scrape_fashion_products(
+                server.base_url, max_pages=50, concurrency=4, discover_pages=True
+            )
+            requested = server.requested_paths
+        
+        # Verifikasi
+        self.assertEqual(len(result), 18)
+        # Halaman 1 untuk discovery, probe /page7, lalu 6 halaman crawl
+        self.assertEqual(len(requested), 8)
+        self.assertEqual(requested.count("/page7"), 1)
+
+class TestSession(unittest.TestCase):
+    
+    def test_session_reuses_connection(self):
+        """Test satu session crawl memakai ulang koneksi keep-alive"""
+        with CatalogServer(total_pages=5) as server:
+            result = scrape_fashion_products(server.base_url, max_pages=5, delay=0)
+            ports = server.client_ports
+        
+        # Verifikasi
+        self.assertEqual(len(result), 15)
+        self.assertEqual(len(ports), 1)
+    
+    def test_retry_honours_retry_after(self):
+        """Test retry pada status 503 menunggu sesuai header Retry-After"""
+        session = create_session(pool_size=1, max_retries=3, backoff_factor=0)
+        with CatalogServer(total_pages=1, failures=1, retry_after=1) as server:
+            start = time.perf_counter()
+            result = fetching_content(server.base_url, session=session)
+            elapsed = time.perf_counter() - start
+            requested = len(server.requested_paths)
+        session.close()
+        
+        # Verifikasi
+        self.assertIsNotNone(result)
+        self.assertEqual(requested, 2)
+        self.assertGreaterEqual(elapsed, 1.0)
+    
+    def test_retry_exhausted_returns_none(self):
+        """Test fetching_content mengembalikan None setelah retry habis"""
+        session = create_session(pool_size=1, max_retries=2, backoff_factor=0)
+        with CatalogServer(total_pages=1, failures=10) as server:
+            result = fetching_content(server.base_url, session=session)
+            requested = len(server.requested_paths)
+        session.close()
+        
+        # Verifikasi
+        self.assertIsNone(result)
+        self.assertEqual(requested, 3)  # 1 request awal + 2 retry
+    
+    def test_timeout(self):
+        """Test server yang menggantung tidak menahan proses selamanya"""
+        session = create_session(pool_size=1, max_retries=0)
+        with CatalogServer(total_pages=1, latency=1.0) as server:
+            start = time.perf_counter()
+            result = fetching_content(server.base_url, session=session, timeout=0.2)
+            elapsed = time.perf_counter() - start
+        session.close()
+        
+        # Verifikasi
+        self.assertIsNone(result)
+        self.assertLess(elapsed, 1.0)
+
+class TestPageCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_conditional_get_reuses_cached_body(self):
+        """Test respons 304 memakai body dari cache"""
+        cache = PageCache(self.cache_dir)
+        with CatalogServer(total_pages=3) as server:
+            first = scrape_fashion_products(server.base_url, max_pages=3, delay=0, cache=cache)
+            second = scrape_fashion_products(server.base_url, max_pages=3, delay=0, cache=cache)
+            conditional_requests = server.conditional_requests
+        
+        # Verifikasi
+        self.assertEqual([p['Title'] for p in first], [p['Title'] for p in second])
+        self.assertEqual(conditional_requests, 3)
+        self.assertEqual(cache.stats()['hits'], 3)
+        self.assertEqual(cache.stats()['misses'], 3)
+    
+    def test_changed_page_is_downloaded_again(self):
+        """Test halaman dengan ETag baru diunduh ulang"""
+        cache = PageCache(self.cache_dir)
+        with CatalogServer(total_pages=1) as server:
+            fetching_content(server.base_url, cache=cache)
+            server.version = 2
+            fetching_content(server.base_url, cache=cache)
+        
+        # Verifikasi
+        self.assertEqual(cache.stats()['hits'], 0)
+        self.assertEqual(cache.stats()['misses'], 2)
+        self.assertEqual(cache.conditional_headers(server.base_url)['If-None-Match'], '"page1-v2"')
+    
+    def test_cache_persists_across_instances(self):
+        """Test validator tetap tersedia setelah cache dibuka ulang"""
+        PageCache(self.cache_dir).store("https://a", b"body", etag='"a"', last_modified="Mon, 01 Jan 2024")
+        cache = PageCache(self.cache_dir)
+        
+        # Verifikasi
+        self.assertEqual(cache.get("https://a"), b"body")
+        self.assertEqual(
+            cache.conditional_headers("https://a"),
+            {"If-None-Match": '"a"', "If-Modified-Since": "Mon, 01 Jan 2024"}
+        )
+    
+    def test_lru_eviction(self):
+        """Test entri yang paling lama tidak dipakai dihapus lebih dulu"""
+        cache = PageCache(self.cache_dir, max_entries=2)
+        cache.store("https://a", b"a", etag='"a"')
+        cache.store("https://b", b"b", etag='"b"')
+        cache.get("https://a")  # a menjadi yang terbaru dipakai
+        cache.store("https://c", b"c", etag='"c"')
+        
+        # Verifikasi
+        self.assertIsNone(cache.get("https://b"))
+        self.assertEqual(cache.get("https://a"), b"a")
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertEqual(cache.stats()['entries'], 2)
+    
+    def test_lru_order_persists_across_runs(self):
+        """Test urutan pemakaian dari cache hit tersimpan untuk run berikutnya"""
+        cache = PageCache(self.cache_dir, max_entries=2)
+        cache.store("https://a", b"a", etag='"a"')
+        cache.store("https://b", b"b", etag='"b"')
+        
+        # Run yang hanya berisi cache hit
+        hit_run = PageCache(self.cache_dir, max_entries=2)
+        hit_run.get("https://a")
+        hit_run.flush()
+        
+        next_run = PageCache(self.cache_dir, max_entries=2)
+        next_run.store("https://c", b"c", etag='"c"')
+        
+        # Verifikasi
+        self.assertIsNone(next_run.get("https://b"))
+        self.assertEqual(next_run.get("https://a"), b"a")
+    
+    def test_crawl_flushes_lru_order(self):
+        """Test crawl yang seluruhnya 304 tetap menyimpan urutan LRU"""
+        with CatalogServer(total_pages=2) as server:
+            scrape_fashion_products(server.base_url, max_pages=2, delay=0, cache=PageCache(self.cache_dir))
+            
+            # Run kedua hanya halaman 1 dan seluruhnya cache hit
+            hit_run = PageCache(self.cache_dir, max_entries=2)
+            scrape_fashion_products(server.base_url, max_pages=1, delay=0, cache=hit_run)
+            page_urls = [server.base_url, server.base_url + "/page2"]
+        
+        next_run = PageCache(self.cache_dir, max_entries=2)
+        next_run.store("https://c", b"c", etag='"c"')
+        
+        # Verifikasi - halaman 2 yang paling lama tidak dipakai dihapus
+        self.assertEqual(hit_run.stats()["hits"], 1)
+        self.assertIsNotNone(next_run.get(page_urls[0]))
+        self.assertIsNone(next_run.get(page_urls[1]))
+
+class TestPageIndex(unittest.TestCase):
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.temp_dir.name, "products_pages.json")
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_unchanged_pages_skip_parsing(self):
+        """Test halaman yang tidak berubah tidak di-parse ulang"""
+        with CatalogServer(total_pages=3) as server:
+            first = scrape_fashion_products(
+                server.base_url, max_pages=3, delay=0, page_index=PageIndex(self.index_path)
+            )
+            
+            page_index = PageIndex(self.index_path)
+            with patch('utils.extract.extract_product_data') as mock_extract:
+                second = scrape_fashion_products(server.base_url, max_pages=3, delay=0, page_index=page_index)
+        
+        # Verifikasi
+        mock_extract.assert_not_called()
+        self.assertEqual(page_index.reused_pages, 3)
+        self.assertEqual(page_index.parsed_pages, 0)
+        self.assertEqual(
+            [{k: v for k, v in p.items() if k != 'timestamp'} for p in first],
+            [{k: v for k, v in p.items() if k != 'timestamp'} for p in second]
+        )
+    
+    def test_changed_pages_are_parsed(self):
+        """Test halaman dengan konten berbeda di-parse ulang"""
+        page_index = PageIndex(self.index_path)
+        with CatalogServer(total_pages=2) as server:
+            scrape_fashion_products(server.base_url, max_pages=2, delay=0, page_index=page_index)
+            server.cards_per_page = 4
+            result = scrape_fashion_products(server.base_url, max_pages=2, delay=0, page_index=page_index)
+        
+        # Verifikasi
+        self.assertEqual(len(result), 8)
+        self.assertEqual(page_index.parsed_pages, 4)
+        self.assertEqual(page_index.reused_pages, 0)
+    
+    def test_typed_pages_reused_from_index(self):
+        """Test kolom bertipe disimpan di indeks dan dipakai ulang tanpa parsing"""
+        with CatalogServer(total_pages=2) as server:
+            first = scrape_fashion_products(
+                server.base_url, max_pages=2, delay=0, page_index=PageIndex(self.index_path), typed=True
+            )
+            
+            page_index = PageIndex(self.index_path)
+            with patch('utils.extract._fill_buffer') as mock_parse:
+                second = scrape_fashion_products(
+                    server.base_url, max_pages=2, delay=0, page_index=page_index, typed=True
+                )
+        
+        # Verifikasi
+        mock_parse.assert_not_called()
+        self.assertEqual(page_index.reused_pages, 2)
+        self.assertEqual(len(second), 6)
+        pd.testing.assert_frame_equal(
+            first.to_frame().drop(columns='timestamp'), second.to_frame().drop(columns='timestamp')
+        )
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
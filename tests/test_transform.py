@@ -1,10 +1,18 @@
+import io
+import os
+import json
+import tempfile
 import unittest
 import pandas as pd
 import numpy as np
 from unittest.mock import patch
 from utils.transform import (
     clean_price, clean_rating, clean_colors, clean_size, 
-    clean_gender, remove_invalid_data, convert_data_types, transform_data
+    clean_gender, remove_invalid_data, convert_data_types, transform_data,
+    clean_rating_vectorized, clean_colors_vectorized, clean_size_vectorized,
+    clean_gender_vectorized, memory_usage_report, RowDeduplicator,
+    iter_transform_chunks, StaticRateProvider, FileRateProvider, RateTableProvider,
+    is_typed_frame
 )
 
 class TestTransform(unittest.TestCase):
@@ -31,6 +39,53 @@ class TestTransform(unittest.TestCase):
         self.assertEqual(result.loc[2, 'Price_in_rupiah'], 30 * 16000)
         self.assertTrue(pd.isna(result.loc[1, 'Price_in_rupiah']))
     
+    def test_clean_price_static_rate_provider(self):
+        """Test clean_price dengan kurs tetap yang dikonfigurasi"""
+        result = clean_price(self.test_df, rate_provider=StaticRateProvider(15000))
+        
+        # Verifikasi
+        self.assertEqual(result.loc[0, 'Price_in_rupiah'], 25.99 * 15000)
+        self.assertTrue(pd.isna(result.loc[1, 'Price_in_rupiah']))
+    
+    def test_file_rate_provider(self):
+        """Test kurs dibaca dari file JSON lokal"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "rates.json")
+            with open(path, 'w') as f:
+                json.dump({"USD": 16250}, f)
+            
+            result = clean_price(self.test_df, rate_provider=FileRateProvider(path))
+        
+        # Verifikasi
+        self.assertEqual(result.loc[2, 'Price_in_rupiah'], 30 * 16250)
+    
+    def test_rate_table_provider_by_date(self):
+        """Test kurs historis dipilih per tanggal dan dicari sekali per tanggal unik"""
+        provider = RateTableProvider(pd.DataFrame({
+            "date": ["2023-01-01", "2023-06-01"],
+            "currency": ["USD", "USD"],
+            "rate": [15000, 15500],
+        }))
+        df = pd.DataFrame({
+            "Price": ["$1", "$2", "$3", "$4", "Price Unavailable"],
+            "timestamp": [
+                "2023-06-01 08:00:00", "2023-06-01 20:00:00", "2023-03-15 12:00:00",
+                "2022-12-31 12:00:00", "2023-03-15 12:00:00",
+            ],
+        })
+        
+        result = clean_price(df, rate_provider=provider)
+        clean_price(df, rate_provider=provider)
+        
+        # Verifikasi
+        self.assertEqual(result['Price_in_rupiah'].tolist()[:4], [15500, 31000, 45000, 60000])
+        self.assertEqual(provider.lookups, 3)
+    
+    def test_rate_provider_unknown_currency(self):
+        """Test mata uang tanpa kurs memunculkan ValueError"""
+        with self.assertRaises(ValueError):
+            StaticRateProvider().rate(None, "EUR")
+    
     def test_clean_rating(self):
         """Test clean_rating function"""
         result = clean_rating(self.test_df)
@@ -77,6 +132,26 @@ class TestTransform(unittest.TestCase):
         self.assertTrue("Pants" in result["Title"].values)
         self.assertFalse("Unknown Product" in result["Title"].values)
     
+    def test_remove_invalid_data_duplicates(self):
+        """Test remove_invalid_data menghapus duplikat setelah baris tidak valid dibuang"""
+        df = pd.concat([self.test_df, self.test_df.iloc[[0, 1]]], ignore_index=True)
+        
+        result = remove_invalid_data(df)
+        
+        # Verifikasi - sama dengan filter, dropna, lalu drop_duplicates
+        expected = df[df['Title'] != "Unknown Product"].dropna().drop_duplicates()
+        pd.testing.assert_frame_equal(result, expected)
+    
+    def test_clean_inplace(self):
+        """Test mode inplace mengubah DataFrame tanpa membuat salinan"""
+        df = self.test_df.copy()
+        
+        result = clean_rating(df, inplace=True)
+        
+        # Verifikasi
+        self.assertIs(result, df)
+        self.assertEqual(df.loc[0, 'Rating'], 4.5)
+    
     def test_convert_data_types(self):
         """Test convert_data_types function"""
         # Persiapkan DataFrame yang sudah bersih
@@ -103,6 +178,51 @@ class TestTransform(unittest.TestCase):
         self.assertEqual(result['Gender'].dtype, 'string')
         self.assertEqual(result['timestamp'].dtype, 'string')
     
+    def test_convert_data_types_compact(self):
+        """Test skema compact dengan category, datetime64, int8, dan float32"""
+        clean_df = pd.DataFrame({
+            "Title": ["T-Shirt", "Pants"],
+            "Price_in_rupiah": [415840.0, 480000.0],
+            "Rating": [4.5, 3.8],
+            "Colors": [3, 2],
+            "Size": ["M", "L"],
+            "Gender": ["Men", "Women"],
+            "timestamp": ["2023-06-01 12:00:00", "2023-06-01 12:00:00"]
+        })
+        
+        result = convert_data_types(clean_df, schema="compact")
+        
+        # Verifikasi
+        self.assertEqual(result['Title'].dtype, 'string')
+        self.assertEqual(result['Price_in_rupiah'].dtype, 'float64')
+        self.assertEqual(result['Rating'].dtype, 'float32')
+        self.assertEqual(result['Colors'].dtype, 'int8')
+        self.assertEqual(result['Size'].dtype, 'category')
+        self.assertEqual(result['Gender'].dtype, 'category')
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(result['timestamp']))
+        self.assertEqual(result.loc[0, 'timestamp'], pd.Timestamp("2023-06-01 12:00:00"))
+    
+    def test_memory_usage_report(self):
+        """Test laporan penghematan memori per kolom"""
+        default_df = convert_data_types(pd.DataFrame({
+            "Title": [f"Product {i}" for i in range(1000)],
+            "Price_in_rupiah": 415840.0,
+            "Rating": 4.5,
+            "Colors": 3,
+            "Size": ["M", "L"] * 500,
+            "Gender": ["Men", "Women"] * 500,
+            "timestamp": "2023-06-01 12:00:00"
+        }))
+        compact_df = convert_data_types(default_df, schema="compact")
+        
+        report = memory_usage_report(default_df, compact_df)
+        
+        # Verifikasi
+        self.assertEqual(list(report.index), list(default_df.columns))
+        self.assertGreater(report.loc['Size', 'saved_bytes'], 0)
+        self.assertGreater(report.loc['timestamp', 'saved_bytes'], 0)
+        self.assertEqual(report.loc['Size', 'dtype_after'], 'category')
+    
     def test_transform_data_success(self):
         """Test transform_data function dengan data valid"""
         result = transform_data(self.test_df)
@@ -114,6 +234,91 @@ class TestTransform(unittest.TestCase):
         self.assertTrue("Pants" in result["Title"].values)
         self.assertFalse("Unknown Product" in result["Title"].values)
     
+    def test_vectorized_cleaners_match_python(self):
+        """Test fungsi vectorized menghasilkan output identik dengan versi per baris"""
+        pairs = [
+            (clean_rating, clean_rating_vectorized),
+            (clean_colors, clean_colors_vectorized),
+            (clean_size, clean_size_vectorized),
+            (clean_gender, clean_gender_vectorized),
+        ]
+        valid_df = self.test_df.drop(index=1)
+        
+        # Verifikasi - termasuk kasus dengan dan tanpa baris tidak valid
+        for python_func, vectorized_func in pairs:
+            for df in (self.test_df, valid_df):
+                pd.testing.assert_frame_equal(vectorized_func(df), python_func(df))
+    
+    def test_vectorized_cleaners_all_missing(self):
+        """Test fungsi vectorized pada kolom yang seluruhnya kosong"""
+        df = self.test_df.copy()
+        df['Size'] = np.nan
+        df['Rating'] = None
+        
+        # Verifikasi
+        self.assertTrue(clean_rating_vectorized(df)['Rating'].isna().all())
+        self.assertTrue(all(value is None for value in clean_size_vectorized(df)['Size']))
+    
+    def test_transform_data_vectorized(self):
+        """Test transform_data dengan engine vectorized identik dengan engine python"""
+        result = transform_data(self.test_df, engine="vectorized")
+        
+        # Verifikasi
+        pd.testing.assert_frame_equal(result, transform_data(self.test_df))
+    
+    def test_transform_data_vectorized_non_object_strings(self):
+        """Test engine vectorized identik untuk kolom teks bertipe category dan string[pyarrow]"""
+        for dtype in ("category", "string[pyarrow]"):
+            df = self.test_df.copy()
+            for col in ("Title", "Rating", "Colors", "Size", "Gender"):
+                df[col] = df[col].astype(dtype)
+            
+            result = transform_data(df, engine="vectorized")
+            
+            # Verifikasi
+            self.assertEqual(len(result), 2)
+            pd.testing.assert_frame_equal(result, transform_data(df, engine="python"))
+    
+    def test_transform_data_single_copy(self):
+        """Test mode satu salinan identik dan tidak mengubah input"""
+        original = self.test_df.copy()
+        
+        result = transform_data(self.test_df, single_copy=True)
+        
+        # Verifikasi
+        pd.testing.assert_frame_equal(result, transform_data(self.test_df, single_copy=False))
+        pd.testing.assert_frame_equal(self.test_df, original)
+    
+    def test_transform_data_typed_input(self):
+        """Test input bertipe dari ekstraksi melewati regex dan hasilnya sama"""
+        typed_df = pd.DataFrame({
+            "Title": ["T-Shirt", "Unknown Product", "Pants"],
+            "Price": [25.99, float('nan'), 30.0],
+            "Rating": [4.5, float('nan'), 3.8],
+            "Colors": [3.0, 3.0, 2.0],
+            "Size": ["M", "M", "L"],
+            "Gender": ["Men", "Unisex", "Women"],
+            "timestamp": ["2023-06-01 12:00:00"] * 3
+        })
+        expected = transform_data(self.test_df)
+        
+        with patch('utils.transform.clean_rating') as mock_rating, \
+                patch('utils.transform.clean_rating_vectorized') as mock_vectorized:
+            for engine in ("python", "vectorized"):
+                result = transform_data(typed_df, engine=engine)
+                
+                # Verifikasi
+                pd.testing.assert_frame_equal(result, expected)
+        
+        self.assertTrue(is_typed_frame(typed_df))
+        self.assertFalse(is_typed_frame(self.test_df))
+        mock_rating.assert_not_called()
+        mock_vectorized.assert_not_called()
+    
+    def test_transform_data_unknown_engine(self):
+        """Test transform_data dengan engine yang tidak dikenal"""
+        self.assertIsNone(transform_data(self.test_df, engine="unknown"))
+    
     def test_transform_data_empty(self):
         """Test transform_data function dengan DataFrame kosong"""
         result = transform_data(pd.DataFrame())
@@ -132,5 +337,79 @@ class TestTransform(unittest.TestCase):
             self.assertIsNone(result)
             mock_clean_price.assert_called_once()
 
+class TestChunkedTransform(unittest.TestCase):
+    
+    def setUp(self):
+        """Setup CSV mentah dengan duplikat yang tersebar di beberapa chunk"""
+        rows = []
+        for i in range(10):
+            rows.append({
+                "Title": f"Product {i % 4}" if i != 5 else "Unknown Product",
+                "Price": f"${10 + i % 4}.50",
+                "Rating": f"Rating: ⭐ 4.{i % 4} / 5",
+                "Colors": "3 Colors",
+                "Size": "Size: M",
+                "Gender": "Gender: Men",
+                "timestamp": "2023-06-01 12:00:00"
+            })
+        self.raw_df = pd.DataFrame(rows)
+        self.raw_csv = self.raw_df.to_csv(index=False)
+    
+    def test_row_deduplicator(self):
+        """Test RowDeduplicator membuang baris yang sudah terlihat di chunk sebelumnya"""
+        deduplicator = RowDeduplicator()
+        df = pd.DataFrame({"a": [1, 2, 2, 3], "b": ["x", "y", "y", "z"]})
+        
+        first = deduplicator.filter(df.iloc[:2])
+        second = deduplicator.filter(df.iloc[2:])
+        
+        # Verifikasi
+        self.assertEqual(first["a"].tolist(), [1, 2])
+        self.assertEqual(second["a"].tolist(), [3])
+        self.assertEqual(len(deduplicator), 3)
+    
+    def test_row_deduplicator_many_chunks(self):
+        """Test deduplikasi lintas banyak chunk sama dengan drop_duplicates dan array tetap sedikit"""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({"a": rng.integers(0, 5000, 20000), "b": rng.integers(0, 3, 20000)})
+        deduplicator = RowDeduplicator()
+        
+        result = pd.concat(deduplicator.filter(df.iloc[start:start + 100]) for start in range(0, len(df), 100))
+        
+        # Verifikasi
+        pd.testing.assert_frame_equal(result, df.drop_duplicates())
+        self.assertEqual(len(deduplicator), len(result))
+        self.assertLessEqual(len(deduplicator._runs), 2 * int(np.log2(len(result))))
+    
+    def test_iter_transform_chunks_matches_full_transform(self):
+        """Test hasil per chunk sama dengan transformasi seluruh data sekaligus"""
+        chunks = list(iter_transform_chunks(io.StringIO(self.raw_csv), chunksize=3))
+        result = pd.concat(chunks)
+        expected = transform_data(self.raw_df)
+        
+        # Verifikasi
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(len(result), 4)
+        pd.testing.assert_frame_equal(result, expected)
+    
+    def test_transform_data_parallel_matches_serial(self):
+        """Test transformasi paralel menghasilkan data yang sama dengan serial"""
+        for schema in ("default", "compact"):
+            expected = transform_data(self.raw_df, engine="vectorized", schema=schema)
+            result = transform_data(self.raw_df, engine="vectorized", schema=schema, workers=3)
+            
+            # Verifikasi duplikat lintas partisi ikut terbuang
+            self.assertEqual(len(result), 4)
+            pd.testing.assert_frame_equal(result, expected)
+    
+    def test_transform_data_parallel_more_workers_than_rows(self):
+        """Test jumlah partisi dibatasi jumlah baris"""
+        raw_df = self.raw_df.iloc[:2]
+        
+        result = transform_data(raw_df, workers=8)
+        
+        # Verifikasi
+        pd.testing.assert_frame_equal(result, transform_data(raw_df))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
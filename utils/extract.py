@@ -1,5 +1,18 @@
+import os
+import re
+import json
 import time
+import hashlib
+import threading
+import importlib.util
+from array import array
+from functools import lru_cache
+from collections import deque, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import pandas as pd
 from datetime import datetime
@@ -12,149 +25,1241 @@ HEADERS = {
     )
 }
 
-def fetching_content(url):
-    """Mengambil konten HTML dari URL yang diberikan."""
+# URL katalog dan jumlah maksimum halaman yang di-scrape
+BASE_URL = "https://fashion-studio.dicoding.dev"
+MAX_PAGES = 50
+
+# Pengaturan default untuk mode scraping konkuren
+DEFAULT_CONCURRENCY = 8
+DEFAULT_REQUESTS_PER_SECOND = 5
+
+# Pengaturan default politeness per host untuk crawl multi-proses
+DEFAULT_MAX_IN_FLIGHT_PER_HOST = 4
+DEFAULT_HOST_INTERVAL = 0.2
+
+# Pengaturan default untuk session HTTP: (connect timeout, read timeout) dalam detik
+DEFAULT_TIMEOUT = (5, 30)
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Pengaturan default untuk cache halaman di disk
+DEFAULT_CACHE_DIR = ".page_cache"
+DEFAULT_CACHE_MAX_ENTRIES = 500
+DEFAULT_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Backend parser HTML yang didukung, dari yang paling lambat ke yang paling cepat
+PARSER_BACKENDS = ("html.parser", "lxml", "selectolax")
+DEFAULT_PARSER = "html.parser"
+
+# Label paragraf pada kartu produk beserta nilai default jika tidak ditemukan
+PRODUCT_FIELD_LABELS = (
+    ("Rating", "Rating:"),
+    ("Colors", "Colors:"),
+    ("Size", "Size:"),
+    ("Gender", "Gender:"),
+)
+PRODUCT_FIELD_DEFAULTS = {
+    "Rating": "Invalid Rating",
+    "Colors": "3 Colors",
+    "Size": "Size: M",
+    "Gender": "Gender: Unisex",
+}
+
+# Lokasi default indeks hash konten halaman, disimpan di samping products.csv
+DEFAULT_PAGE_INDEX_PATH = "products_pages.json"
+
+# Session bersama untuk pemanggilan fetching_content tanpa session eksplisit
+_session = None
+_session_lock = threading.Lock()
+
+class RateLimiter:
+    """
+    Membatasi laju request secara global (requests per second) dan aman
+    dipakai bersama oleh beberapa thread.
+    
+    Args:
+        requests_per_second (float): Batas request per detik, None berarti tanpa batas
+    """
+    
+    def __init__(self, requests_per_second=None):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+    
+    def wait(self):
+        """Menunggu sampai slot request berikutnya tersedia."""
+        if not self.interval:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+class PageCache:
+    """
+    Cache halaman HTML di disk untuk conditional GET.
+    
+    Setiap entri menyimpan body respons beserta validator ETag/Last-Modified.
+    Ukuran cache dibatasi jumlah entri dan total byte, entri yang paling lama
+    tidak dipakai dihapus lebih dulu (LRU). Indeks disimpan di index.json;
+    urutan pemakaian dari cache hit disimpan lewat flush() di akhir crawl.
+    
+    Args:
+        cache_dir (str): Direktori penyimpanan cache
+        max_entries (int): Jumlah maksimum halaman yang disimpan
+        max_bytes (int): Total ukuran maksimum body yang disimpan
+    """
+    
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_entries=DEFAULT_CACHE_MAX_ENTRIES,
+                 max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._dirty = False
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, encoding="utf-8") as f:
+                    self._entries = OrderedDict(json.load(f))
+            except (OSError, ValueError) as e:
+                print(f"Indeks cache {self.index_path} tidak dapat dibaca, cache dikosongkan: {e}")
+    
+    def _body_path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".html")
+    
+    def _save_index(self):
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(list(self._entries.items()), f)
+        os.replace(temp_path, self.index_path)
+        self._dirty = False
+    
+    def _evict(self):
+        total_bytes = sum(entry["size"] for entry in self._entries.values())
+        while self._entries and (len(self._entries) > self.max_entries or total_bytes > self.max_bytes):
+            url, entry = self._entries.popitem(last=False)
+            total_bytes -= entry["size"]
+            self.evictions += 1
+            try:
+                os.remove(self._body_path(url))
+            except OSError:
+                pass
+    
+    def conditional_headers(self, url):
+        """Membuat header If-None-Match/If-Modified-Since untuk URL yang sudah di-cache."""
+        with self._lock:
+            entry = self._entries.get(url)
+        
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+    
+    def get(self, url):
+        """Mengambil body yang tersimpan dan menandainya sebagai baru dipakai."""
+        with self._lock:
+            if url not in self._entries:
+                return None
+            self._entries.move_to_end(url)
+            self._dirty = True
+        
+        try:
+            with open(self._body_path(url), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def store(self, url, body, etag=None, last_modified=None):
+        """Menyimpan body beserta validatornya, lalu menjalankan eviksi LRU."""
+        if not etag and not last_modified:
+            return  # Tanpa validator, conditional GET tidak mungkin dilakukan
+        
+        with self._lock:
+            with open(self._body_path(url), "wb") as f:
+                f.write(body)
+            self._entries[url] = {"etag": etag, "last_modified": last_modified, "size": len(body)}
+            self._entries.move_to_end(url)
+            self._evict()
+            self._save_index()
+    
+    def flush(self):
+        """Menyimpan indeks jika urutan LRU berubah karena cache hit sejak penyimpanan terakhir."""
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+    
+    def record_hit(self):
+        with self._lock:
+            self.hits += 1
+    
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+    
+    def stats(self):
+        """
+        Mengambil statistik pemakaian cache.
+        
+        Returns:
+            dict: Jumlah hit, miss, eviksi, entri, dan total byte yang tersimpan
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": sum(entry["size"] for entry in self._entries.values())
+            }
+
+class UrlFrontier:
+    """
+    Antrian URL halaman dengan batas politeness per host.
+    
+    URL dikelompokkan per host dan diambil bergiliran antar host. Sebuah host
+    hanya boleh memiliki max_in_flight request yang sedang berjalan dan jarak
+    minimal min_interval detik antar request yang dimulai.
+    
+    Args:
+        max_in_flight (int): Jumlah maksimum request berjalan per host
+        min_interval (float): Jarak minimal antar request ke host yang sama dalam detik
+    """
+    
+    def __init__(self, max_in_flight=DEFAULT_MAX_IN_FLIGHT_PER_HOST, min_interval=DEFAULT_HOST_INTERVAL):
+        self.max_in_flight = max_in_flight
+        self.min_interval = min_interval
+        self._queues = OrderedDict()
+        self._in_flight = defaultdict(int)
+        self._next_time = defaultdict(float)
+    
+    def __len__(self):
+        return sum(len(queue) for queue in self._queues.values())
+    
+    def add(self, key, url):
+        """Menambahkan URL ke antrian host-nya dengan key untuk penggabungan hasil."""
+        host = urlsplit(url).netloc
+        self._queues.setdefault(host, deque()).append((key, url))
+    
+    def discard(self, predicate):
+        """Menghapus URL yang belum diambil dan key-nya memenuhi predicate."""
+        for host, queue in self._queues.items():
+            self._queues[host] = deque(item for item in queue if not predicate(item[0]))
+    
+    def pop_ready(self, now=None):
+        """
+        Mengambil URL berikutnya yang boleh di-request sekarang.
+        
+        Returns:
+            tuple: (key, url) atau None jika tidak ada host yang siap
+        """
+        now = time.monotonic() if now is None else now
+        for host in list(self._queues):
+            queue = self._queues[host]
+            if not queue or self._in_flight[host] >= self.max_in_flight or now < self._next_time[host]:
+                continue
+            
+            # Pindahkan host ke belakang agar host lain mendapat giliran
+            self._queues.move_to_end(host)
+            self._in_flight[host] += 1
+            self._next_time[host] = now + self.min_interval
+            return queue.popleft()
+        return None
+    
+    def wait_time(self, now=None):
+        """Lama waktu sampai ada host yang siap, None jika semua host menunggu request selesai."""
+        now = time.monotonic() if now is None else now
+        waits = [
+            max(self._next_time[host] - now, 0.0)
+            for host, queue in self._queues.items()
+            if queue and self._in_flight[host] < self.max_in_flight
+        ]
+        return min(waits) if waits else None
+    
+    def done(self, url):
+        """Menandai request ke URL sudah selesai."""
+        self._in_flight[urlsplit(url).netloc] -= 1
+
+class PageIndex:
+    """
+    Indeks hash konten per halaman untuk ekstraksi inkremental.
+    
+    Untuk setiap URL disimpan hash SHA-256 dari konten halaman beserta
+    baris produk hasil ekstraksinya. Halaman dengan konten yang identik
+    dengan run sebelumnya tidak perlu di-parse ulang.
+    
+    Args:
+        index_path (str): Path file JSON indeks
+    """
+    
+    def __init__(self, index_path=DEFAULT_PAGE_INDEX_PATH):
+        self.index_path = index_path
+        self.reused_pages = 0
+        self.parsed_pages = 0
+        self._pages = {}
+        
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, encoding="utf-8") as f:
+                    self._pages = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Indeks halaman {index_path} tidak dapat dibaca, semua halaman akan di-parse: {e}")
+    
+    @staticmethod
+    def content_hash(content):
+        """Menghitung hash SHA-256 dari konten halaman."""
+        return hashlib.sha256(content).hexdigest()
+    
+    def lookup(self, url, digest, key="rows"):
+        """
+        Mengambil baris produk dari run sebelumnya jika hash halaman sama.
+        
+        Args:
+            url (str): URL halaman
+            digest (str): Hash konten halaman saat ini
+            key (str): "rows" untuk list dict, atau INDEX_KEY buffer per kolom
+        
+        Returns:
+            list | dict: Baris/kolom produk atau None jika halaman berubah/belum terindeks
+        """
+        entry = self._pages.get(url)
+        if entry is None or entry["hash"] != digest or key not in entry:
+            return None
+        self.reused_pages += 1
+        return entry[key]
+    
+    def update(self, url, digest, rows, key="rows"):
+        """Menyimpan hash dan baris (atau kolom, sesuai key) produk terbaru untuk sebuah halaman."""
+        self.parsed_pages += 1
+        self._pages[url] = {"hash": digest, key: rows}
+    
+    def save(self):
+        """Menyimpan indeks ke disk secara atomik."""
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._pages, f)
+        os.replace(temp_path, self.index_path)
+
+def create_session(pool_size=DEFAULT_CONCURRENCY, max_retries=DEFAULT_MAX_RETRIES,
+                   backoff_factor=DEFAULT_BACKOFF_FACTOR):
+    """
+    Membuat session HTTP dengan connection pool, keep-alive, dan retry.
+    
+    Retry dilakukan dengan exponential backoff untuk status 429/5xx dan
+    menghormati header Retry-After dari server.
+    
+    Args:
+        pool_size (int): Ukuran connection pool, sesuaikan dengan concurrency crawl
+        max_retries (int): Jumlah maksimum retry per request
+        backoff_factor (float): Faktor exponential backoff antar retry
+        
+    Returns:
+        requests.Session: Session yang siap dipakai ulang
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    return session
+
+def get_session():
+    """Mengambil session bersama tingkat modul, dibuat saat pertama kali dipakai."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+def close_session():
+    """Menutup session bersama tingkat modul beserta koneksinya."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+def fetching_content(url, session=None, timeout=DEFAULT_TIMEOUT, cache=None):
+    """
+    Mengambil konten HTML dari URL yang diberikan.
+    
+    Jika cache diberikan, request dikirim sebagai conditional GET dan body
+    dari cache dipakai ulang ketika server menjawab 304 Not Modified.
+    
+    Args:
+        url (str): URL halaman
+        session (requests.Session): Session yang dipakai, default session bersama
+        timeout (float | tuple): Timeout request dalam detik
+        cache (PageCache): Cache halaman di disk, opsional
+        
+    Returns:
+        bytes: Konten halaman atau None jika terjadi error
+    """
     try:
-        session = requests.Session()
-        response = session.get(url, headers=HEADERS)
+        if session is None:
+            session = get_session()
+        
+        headers = cache.conditional_headers(url) if cache else {}
+        response = session.get(url, timeout=timeout, headers=headers)
+        
+        if cache and response.status_code == 304:
+            content = cache.get(url)
+            if content is not None:
+                cache.record_hit()
+                return content
+            
+            # Body cache hilang, ambil ulang tanpa validator
+            response = session.get(url, timeout=timeout)
+        
         response.raise_for_status()
+        
+        if cache:
+            cache.record_miss()
+            cache.store(
+                url,
+                response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
         return response.content
     except requests.exceptions.RequestException as e:
         print(f"Terjadi kesalahan ketika melakukan requests terhadap {url}: {e}")
         return None
 
-def extract_product_data(card):
+def _classify_paragraphs(texts):
+    """
+    Mengelompokkan teks paragraf kartu produk ke field dalam satu kali lintasan.
+    
+    Setiap teks diperiksa sekali terhadap semua label, paragraf pertama yang
+    mengandung label menjadi nilai field tersebut.
+    
+    Args:
+        texts (iterable): Teks setiap elemen <p> sesuai urutan dokumen
+        
+    Returns:
+        dict: Nilai Rating, Colors, Size, dan Gender (dengan default)
+    """
+    fields = {}
+    for text in texts:
+        if not text:
+            continue
+        for field, label in PRODUCT_FIELD_LABELS:
+            if field not in fields and label in text:
+                fields[field] = text.strip()
+        if len(fields) == len(PRODUCT_FIELD_LABELS):
+            break
+    
+    for field, default in PRODUCT_FIELD_DEFAULTS.items():
+        fields.setdefault(field, default)
+    return fields
+
+def _card_parts(card):
+    """
+    Mengambil judul, harga, dan field teks dari kartu produk BeautifulSoup.
+    
+    Args:
+        card (BeautifulSoup element): Elemen HTML dengan class 'collection-card'
+        
+    Returns:
+        tuple: (judul, teks harga, dict field dari _classify_paragraphs)
+    """
+    # Ekstrak judul produk
+    title_element = card.find('h3', class_='product-title')
+    title = title_element.text.strip() if title_element else "Unknown Product"
+    
+    # Ekstrak harga
+    price_element = card.find('span', class_='price')
+    price = price_element.text.strip() if price_element else "Price Unavailable"
+    
+    # Ekstrak rating, warna, ukuran, dan gender dalam satu kali lintasan <p>
+    fields = _classify_paragraphs(p.string for p in card.find_all('p'))
+    return title, price, fields
+
+def _node_string(node):
+    """
+    Padanan Tag.string BeautifulSoup untuk node selectolax.
+    
+    Mengembalikan teks hanya jika node (secara berantai) memiliki tepat satu
+    anak berupa teks, misalnya <p>x</p> atau <p><span>x</span></p>. Markup
+    campuran seperti <p>Colors: <b>3</b></p> menghasilkan None, sama seperti
+    p.string, sehingga kedua backend mengklasifikasikan <p> secara identik.
+    """
+    while True:
+        children = list(node.iter(include_text=True))
+        if len(children) != 1:
+            return None
+        node = children[0]
+        if node.tag == '-text':
+            return node.text()
+
+def _card_parts_selectolax(card):
+    """
+    Mengambil judul, harga, dan field teks dari node kartu selectolax.
+    
+    Args:
+        card (selectolax Node): Node HTML dengan class 'collection-card'
+        
+    Returns:
+        tuple: (judul, teks harga, dict field dari _classify_paragraphs)
+    """
+    title_element = card.css_first('h3.product-title')
+    title = title_element.text(strip=True) if title_element else "Unknown Product"
+    
+    price_element = card.css_first('span.price')
+    price = price_element.text(strip=True) if price_element else "Price Unavailable"
+    
+    fields = _classify_paragraphs(_node_string(p) for p in card.css('p'))
+    return title, price, fields
+
+def _now_timestamp():
+    """Waktu ekstraksi dalam format yang disimpan di kolom timestamp."""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def extract_product_data(card, timestamp=None):
     """
     Mengambil data produk fashion dari elemen HTML.
     
     Args:
         card (BeautifulSoup element): Elemen HTML dengan class 'collection-card'
+        timestamp (str): Waktu ekstraksi halaman, default waktu saat ini
         
     Returns:
         dict: Dictionary berisi data produk atau None jika terjadi error
     """
     try:
-        # Berdasarkan struktur HTML yang diberikan
-        
-        # Ekstrak judul produk
-        title_element = card.find('h3', class_='product-title')
-        title = title_element.text.strip() if title_element else "Unknown Product"
-        
-        # Ekstrak harga
-        price_element = card.find('span', class_='price')
-        price = price_element.text.strip() if price_element else "Price Unavailable"
-        
-        # Ekstrak rating
-        rating_element = card.find('p', string=lambda text: text and 'Rating:' in text)
-        if rating_element:
-            rating = rating_element.text.strip()
-        else:
-            rating = "Invalid Rating"
+        title, price, fields = _card_parts(card)
         
-        # Ekstrak warna
-        colors_element = card.find('p', string=lambda text: text and 'Colors:' in text)
-        colors = colors_element.text.strip() if colors_element else "3 Colors"
+        # Tambahkan timestamp
+        timestamp = timestamp or _now_timestamp()
         
-        # Ekstrak ukuran
-        size_element = card.find('p', string=lambda text: text and 'Size:' in text)
-        size = size_element.text.strip() if size_element else "Size: M"
+        return {
+            "Title": title,
+            "Price": price,
+            "Rating": fields["Rating"],
+            "Colors": fields["Colors"],
+            "Size": fields["Size"],
+            "Gender": fields["Gender"],
+            "timestamp": timestamp
+        }
+    except Exception as e:
+        print(f"Error saat mengekstrak data produk: {e}")
+        return None
+
+def _extract_product_data_selectolax(card, timestamp=None):
+    """
+    Mengambil data produk fashion dari node selectolax.
+    
+    Args:
+        card (selectolax Node): Node HTML dengan class 'collection-card'
+        timestamp (str): Waktu ekstraksi halaman, default waktu saat ini
         
-        # Ekstrak gender
-        gender_element = card.find('p', string=lambda text: text and 'Gender:' in text)
-        gender = gender_element.text.strip() if gender_element else "Gender: Unisex"
+    Returns:
+        dict: Dictionary berisi data produk atau None jika terjadi error
+    """
+    try:
+        title, price, fields = _card_parts_selectolax(card)
         
-        # Tambahkan timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = timestamp or _now_timestamp()
         
         return {
             "Title": title,
             "Price": price,
-            "Rating": rating,
-            "Colors": colors,
-            "Size": size,
-            "Gender": gender,
+            "Rating": fields["Rating"],
+            "Colors": fields["Colors"],
+            "Size": fields["Size"],
+            "Gender": fields["Gender"],
             "timestamp": timestamp
         }
     except Exception as e:
         print(f"Error saat mengekstrak data produk: {e}")
         return None
 
-def scrape_fashion_products(base_url, max_pages=50, delay=2):
+# Pola angka untuk jalur ekstraksi bertipe, sama dengan regex di utils/transform.py
+_PRICE_PATTERN = re.compile(r'\$(\d+\.?\d*)')
+_NUMBER_PATTERN = re.compile(r'([\d.]+)')
+_INTEGER_PATTERN = re.compile(r'(\d+)')
+
+@lru_cache(maxsize=4096)
+def _parse_price(text):
+    """Harga USD dari teks "$12.50", NaN jika harga tidak tersedia."""
+    match = _PRICE_PATTERN.search(text) if '$' in text else None
+    return float(match.group(1)) if match else float('nan')
+
+@lru_cache(maxsize=4096)
+def _parse_number(text, integer=False):
+    """Angka pertama dari teks rating atau jumlah warna, NaN jika tidak ada."""
+    match = (_INTEGER_PATTERN if integer else _NUMBER_PATTERN).search(text)
+    return float(match.group(1)) if match else float('nan')
+
+@lru_cache(maxsize=256)
+def _strip_label(text, label):
+    """Teks field tanpa label, nilai yang sama dipakai bersama antar baris."""
+    return text.replace(label, '').strip()
+
+class ProductRecords:
     """
-    Fungsi utama untuk mengambil data produk fashion dari semua halaman.
+    Buffer per kolom untuk data produk hasil ekstraksi.
+    
+    Alih-alih list dict 7 kunci per kartu, setiap nilai ditambahkan ke list
+    kolomnya masing-masing, dan timestamp satu halaman cukup dibuat sekali
+    lalu dipakai bersama oleh semua baris. Buffer dapat langsung diubah
+    menjadi DataFrame tanpa list dict perantara.
+    """
+    
+    __slots__ = ("_columns",)
+    
+    COLUMNS = ("Title", "Price", "Rating", "Colors", "Size", "Gender", "timestamp")
+    NUMERIC_COLUMNS = ()
+    
+    # Kunci penyimpanan di PageIndex, dibedakan per jenis buffer
+    INDEX_KEY = "raw_columns"
+    
+    def __init__(self):
+        self._columns = {
+            column: array('d') if column in self.NUMERIC_COLUMNS else []
+            for column in self.COLUMNS
+        }
+    
+    def __len__(self):
+        return len(self._columns["Title"])
+    
+    def append(self, title, price, fields, timestamp):
+        """
+        Menambahkan satu kartu produk.
+        
+        Args:
+            title (str): Judul produk
+            price (str): Teks harga
+            fields (dict): Teks Rating, Colors, Size, dan Gender
+            timestamp (str): Waktu ekstraksi halaman
+        """
+        columns = self._columns
+        columns["Title"].append(title)
+        columns["Price"].append(price)
+        columns["Rating"].append(fields["Rating"])
+        columns["Colors"].append(fields["Colors"])
+        columns["Size"].append(fields["Size"])
+        columns["Gender"].append(fields["Gender"])
+        columns["timestamp"].append(timestamp)
+    
+    def extend(self, other):
+        """Menambahkan seluruh baris dari buffer lain."""
+        for column, values in self._columns.items():
+            values.extend(other._columns[column])
+    
+    def to_dict(self):
+        """
+        Mengambil isi buffer sebagai list per kolom tanpa timestamp.
+        
+        Returns:
+            dict: List nilai per kolom, dapat disimpan sebagai JSON di PageIndex
+        """
+        return {
+            column: list(values) for column, values in self._columns.items()
+            if column != "timestamp"
+        }
+    
+    @classmethod
+    def from_dict(cls, columns, timestamp):
+        """
+        Membuat buffer dari hasil to_dict dengan timestamp baru.
+        
+        Args:
+            columns (dict): List nilai per kolom
+            timestamp (str): Waktu ekstraksi untuk semua baris
+            
+        Returns:
+            ProductRecords: Buffer berisi baris yang sama
+        """
+        buffer = cls()
+        for column, values in columns.items():
+            buffer._columns[column].extend(values)
+        buffer._columns["timestamp"].extend([timestamp] * len(buffer))
+        return buffer
+    
+    def to_frame(self):
+        """
+        Mengubah buffer menjadi DataFrame tanpa melewati dict per baris.
+        
+        Returns:
+            pd.DataFrame: Satu kolom per field produk
+        """
+        return pd.DataFrame({
+            column: pd.array(values, dtype='float64') if column in self.NUMERIC_COLUMNS else values
+            for column, values in self._columns.items()
+        })
+
+class ProductColumns(ProductRecords):
+    """
+    Buffer kolom bertipe untuk jalur ekstraksi-dan-pembersihan sekaligus.
+    
+    Nilai langsung disimpan dalam bentuk bertipe: Price (USD) dan Rating
+    sebagai float, Colors sebagai angka, Size dan Gender tanpa label, sehingga
+    transform_data tidak perlu menjalankan regex lagi pada kolom tersebut.
+    Teks yang berulang (rating, ukuran, dsb.) hanya di-parse sekali berkat cache.
+    """
+    
+    __slots__ = ()
+    
+    NUMERIC_COLUMNS = ("Price", "Rating", "Colors")
+    INDEX_KEY = "columns"
+    
+    def append(self, title, price, fields, timestamp):
+        """
+        Menambahkan satu kartu produk dalam bentuk bertipe.
+        
+        Args:
+            title (str): Judul produk
+            price (str): Teks harga
+            fields (dict): Teks Rating, Colors, Size, dan Gender
+            timestamp (str): Waktu ekstraksi halaman
+        """
+        columns = self._columns
+        columns["Title"].append(title)
+        columns["Price"].append(_parse_price(price))
+        columns["Rating"].append(_parse_number(fields["Rating"]))
+        columns["Colors"].append(_parse_number(fields["Colors"], integer=True))
+        columns["Size"].append(_strip_label(fields["Size"], 'Size:'))
+        columns["Gender"].append(_strip_label(fields["Gender"], 'Gender:'))
+        columns["timestamp"].append(timestamp)
+
+def available_parsers():
+    """
+    Mengambil daftar backend parser yang terpasang.
+    
+    Returns:
+        list: Nama backend sesuai urutan PARSER_BACKENDS
+    """
+    modules = {"html.parser": None, "lxml": "lxml", "selectolax": "selectolax"}
+    return [
+        name for name in PARSER_BACKENDS
+        if modules[name] is None or importlib.util.find_spec(modules[name]) is not None
+    ]
+
+def resolve_parser(parser=DEFAULT_PARSER):
+    """
+    Menentukan backend parser yang akan dipakai.
     
     Args:
-        base_url (str): URL dasar website
-        max_pages (int): Jumlah maksimum halaman yang akan di-scrape
-        delay (int): Delay antar request dalam detik
+        parser (str): Nama backend, atau "auto" untuk backend tercepat yang terpasang
         
     Returns:
-        list: List berisi data semua produk
+        str: Nama backend yang tersedia, fallback ke html.parser jika tidak terpasang
     """
-    data = []
+    if parser == "auto":
+        return available_parsers()[-1]
     
-    # Buat daftar URL untuk semua halaman
+    if parser not in PARSER_BACKENDS:
+        raise ValueError(f"Parser tidak dikenal: {parser}. Pilihan: {', '.join(PARSER_BACKENDS)}")
+    
+    if parser not in available_parsers():
+        print(f"Parser {parser} tidak terpasang, menggunakan {DEFAULT_PARSER}")
+        return DEFAULT_PARSER
+    
+    return parser
+
+def _record_buffer_class(typed=False, columnar=False):
+    """Kelas buffer per kolom yang dipakai, None berarti list dict."""
+    if typed:
+        return ProductColumns
+    return ProductRecords if columnar else None
+
+def _fill_buffer(buffer, cards, card_parts, timestamp):
+    """
+    Mengisi buffer per kolom dari kartu produk, kartu yang gagal dilewati.
+    
+    Args:
+        buffer (ProductRecords): Buffer tujuan
+        cards (list): Elemen kartu produk
+        card_parts (callable): _card_parts atau _card_parts_selectolax
+        timestamp (str): Waktu ekstraksi halaman
+        
+    Returns:
+        ProductRecords: Buffer yang sudah diisi
+    """
+    for card in cards:
+        try:
+            title, price, fields = card_parts(card)
+            buffer.append(title, price, fields, timestamp)
+        except Exception as e:
+            print(f"Error saat mengekstrak data produk: {e}")
+    return buffer
+
+def parse_product_page(content, parser=DEFAULT_PARSER, typed=False, columnar=False):
+    """
+    Mem-parse satu halaman katalog menjadi data produk.
+    
+    Timestamp dibuat sekali per halaman dan dipakai oleh semua kartu.
+    
+    Args:
+        content (bytes): Konten HTML halaman
+        parser (str): Nama backend parser yang sudah di-resolve
+        typed (bool): Hasilkan ProductColumns bertipe
+        columnar (bool): Hasilkan ProductRecords per kolom alih-alih list dict
+        
+    Returns:
+        tuple: (jumlah kartu produk, list data produk atau buffer per kolom)
+    """
+    timestamp = _now_timestamp()
+    buffer_class = _record_buffer_class(typed, columnar)
+    
+    if parser == "selectolax":
+        try:
+            from selectolax.lexbor import LexborHTMLParser as HTMLParser
+        except ImportError:
+            from selectolax.parser import HTMLParser
+        
+        cards = HTMLParser(content).css('div.collection-card')
+        if buffer_class:
+            return len(cards), _fill_buffer(buffer_class(), cards, _card_parts_selectolax, timestamp)
+        products = [_extract_product_data_selectolax(card, timestamp) for card in cards]
+    else:
+        soup = BeautifulSoup(content, parser)
+        
+        # Gunakan selector yang benar: collection-card
+        cards = soup.find_all('div', class_='collection-card')
+        if buffer_class:
+            return len(cards), _fill_buffer(buffer_class(), cards, _card_parts, timestamp)
+        products = [extract_product_data(card, timestamp) for card in cards]
+    
+    return len(cards), [product for product in products if product]
+
+def build_page_urls(base_url, max_pages):
+    """
+    Membuat daftar URL untuk semua halaman katalog.
+    
+    Args:
+        base_url (str): URL dasar website
+        max_pages (int): Jumlah maksimum halaman
+        
+    Returns:
+        list: List URL dengan urutan halaman 1 sampai max_pages
+    """
     urls = [base_url]  # Halaman 1
     
     # URL untuk halaman 2 sampai max_pages
     for page in range(2, max_pages + 1):
         urls.append(f"{base_url}/page{page}")
     
-    for page_number, url in enumerate(urls, 1):
-        print(f"Scraping halaman {page_number}: {url}")
-        
-        # Ambil konten halaman
-        content = fetching_content(url)
-        if not content:
-            print(f"Gagal mengambil konten halaman {page_number}")
-            if page_number > 1:  # Jangan berhenti di halaman pertama
-                print("Mungkin sudah mencapai halaman terakhir")
-                break
-            continue
-        
-        # Parse HTML
-        soup = BeautifulSoup(content, "html.parser")
+    return urls
+
+def _iter_page_contents(urls, session, delay=2, concurrency=1, requests_per_second=None,
+                        timeout=DEFAULT_TIMEOUT, cache=None):
+    """
+    Mengambil konten setiap halaman dan menghasilkannya sesuai urutan halaman.
+    
+    Dengan concurrency > 1, halaman diambil oleh thread pool dengan jendela
+    geser sebesar concurrency dan laju request dibatasi oleh RateLimiter
+    global sebagai pengganti delay tetap per halaman. Request yang belum
+    berjalan dibatalkan ketika pemanggil berhenti melakukan iterasi.
+    
+    Yields:
+        tuple: (page_number, url, content)
+    """
+    if concurrency <= 1:
+        for page_number, url in enumerate(urls, 1):
+            yield page_number, url, fetching_content(url, session=session, timeout=timeout, cache=cache)
+            
+            # Delay untuk menghindari overload server
+            if page_number < len(urls):
+                time.sleep(delay)
+        return
+    
+    limiter = RateLimiter(requests_per_second)
+    
+    def fetch(url):
+        limiter.wait()
+        return fetching_content(url, session=session, timeout=timeout, cache=cache)
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = deque()
+        next_index = 0
         
-        # Gunakan selector yang benar: collection-card
-        collection_cards = soup.find_all('div', class_='collection-card')
+        try:
+            while next_index < len(urls) and len(pending) < concurrency:
+                pending.append((next_index + 1, urls[next_index], executor.submit(fetch, urls[next_index])))
+                next_index += 1
+            
+            while pending:
+                page_number, url, future = pending.popleft()
+                
+                # Jaga jumlah request yang berjalan tetap sebesar concurrency
+                if next_index < len(urls):
+                    pending.append((next_index + 1, urls[next_index], executor.submit(fetch, urls[next_index])))
+                    next_index += 1
+                
+                yield page_number, url, future.result()
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+
+def _page_has_products(url, session, timeout, parser):
+    """Memeriksa apakah halaman dapat diambil dan berisi kartu produk."""
+    content = fetching_content(url, session=session, timeout=timeout)
+    return bool(content) and parse_product_page(content, parser)[0] > 0
+
+def discover_page_count(base_url, max_pages=50, session=None, timeout=DEFAULT_TIMEOUT, parser=DEFAULT_PARSER,
+                        cache=None):
+    """
+    Menentukan jumlah halaman katalog sebelum crawl dimulai.
+    
+    Pertama dicari teks "Page X of N" atau link pagination /pageN di halaman 1.
+    Link terbesar hanya dipercaya jika halaman sesudahnya kosong, karena
+    paginator "Next" sering hanya menautkan /page2. Jika tidak ada petunjuk
+    atau halaman sesudahnya masih berisi produk, halaman dicari dengan
+    exponential probing (2, 3, 5, 9, ...) lalu binary search di antara
+    halaman terakhir yang berisi produk dan halaman pertama yang kosong.
+    
+    Args:
+        base_url (str): URL dasar website
+        max_pages (int): Batas atas jumlah halaman
+        session (requests.Session): Session HTTP, default session bersama
+        timeout (float | tuple): Timeout setiap request dalam detik
+        parser (str): Backend parser HTML
+        cache (PageCache): Cache halaman, halaman 1 disimpan agar crawl cukup
+            melakukan conditional GET untuknya
         
-        if not collection_cards:
-            print(f"Tidak ada produk ditemukan di halaman {page_number}")
-            if page_number > 1:  # Jangan berhenti di halaman pertama
-                print("Kemungkinan sudah mencapai halaman terakhir")
-                break
-            continue
+    Returns:
+        int: Jumlah halaman, atau max_pages jika halaman 1 gagal diambil
+    """
+    parser = resolve_parser(parser)
+    urls = build_page_urls(base_url, max_pages)
+    
+    content = fetching_content(urls[0], session=session, timeout=timeout, cache=cache)
+    if not content:
+        print(f"Gagal mengambil halaman 1, memakai batas {max_pages} halaman")
+        return max_pages
+    
+    text = content.decode("utf-8", errors="ignore")
+    total_match = re.search(r"Page\s+\d+\s+of\s+(\d+)", text)
+    if total_match:
+        return min(int(total_match.group(1)), max_pages)
+    
+    last_found = 1
+    linked_pages = [int(page) for page in re.findall(r"href=[\"'][^\"']*/page(\d+)[\"']", text)]
+    if linked_pages:
+        last_linked = min(max(linked_pages), max_pages)
+        if last_linked == max_pages or not _page_has_products(urls[last_linked], session, timeout, parser):
+            return last_linked
+        # Halaman sesudah link terakhir masih berisi produk, lanjutkan probing dari sana
+        last_found = last_linked + 1
+    
+    # Exponential probing sampai menemukan halaman kosong
+    step = 1
+    while True:
+        probe = min(last_found + step, max_pages)
+        if probe == last_found:
+            return last_found
+        if not _page_has_products(urls[probe - 1], session, timeout, parser):
+            break
+        last_found = probe
+        step *= 2
+    
+    # Binary search di antara halaman berisi produk dan halaman kosong
+    first_missing = probe
+    while first_missing - last_found > 1:
+        middle = (last_found + first_missing) // 2
+        if _page_has_products(urls[middle - 1], session, timeout, parser):
+            last_found = middle
+        else:
+            first_missing = middle
+    return last_found
+
+def iter_product_batches(base_url, max_pages=50, delay=2, concurrency=1, requests_per_second=None,
+                         session=None, timeout=DEFAULT_TIMEOUT, cache=None, page_index=None,
+                         parser=DEFAULT_PARSER, discover_pages=False, typed=False, columnar=False):
+    """
+    Generator yang menghasilkan data produk per halaman sesuai urutan halaman.
+    
+    Setiap batch dihasilkan segera setelah halamannya di-parse, sehingga
+    pemanggil dapat memproses data sementara halaman berikutnya masih
+    diambil oleh thread pool (mode konkuren). Argumen sama dengan
+    scrape_fashion_products.
+    
+    Yields:
+        list | ProductRecords: Data produk dari satu halaman
+    """
+    parser = resolve_parser(parser)
+    buffer_class = _record_buffer_class(typed, columnar)
+    index_key = buffer_class.INDEX_KEY if buffer_class else "rows"
+    
+    # Satu session untuk seluruh crawl agar koneksi dipakai ulang
+    owns_session = session is None
+    if owns_session:
+        session = create_session(pool_size=max(concurrency, 1))
+    
+    # Buat daftar URL untuk semua halaman
+    if discover_pages:
+        max_pages = discover_page_count(base_url, max_pages, session, timeout, parser, cache=cache)
+        print(f"Ditemukan {max_pages} halaman katalog")
+    urls = build_page_urls(base_url, max_pages)
+    
+    pages = _iter_page_contents(urls, session, delay, concurrency, requests_per_second, timeout, cache)
+    try:
+        for page_number, url, content in pages:
+            print(f"Scraping halaman {page_number}: {url}")
+            
+            if not content:
+                print(f"Gagal mengambil konten halaman {page_number}")
+                if page_number > 1:  # Jangan berhenti di halaman pertama
+                    print("Mungkin sudah mencapai halaman terakhir")
+                    break
+                continue
+            
+            # Pakai ulang hasil ekstraksi jika konten halaman tidak berubah
+            if page_index is not None:
+                digest = page_index.content_hash(content)
+                previous_rows = page_index.lookup(url, digest, key=index_key)
+                if previous_rows is not None:
+                    timestamp = _now_timestamp()
+                    if buffer_class:
+                        previous_rows = buffer_class.from_dict(previous_rows, timestamp)
+                    else:
+                        previous_rows = [dict(row, timestamp=timestamp) for row in previous_rows]
+                    print(f"Halaman {page_number} tidak berubah, memakai {len(previous_rows)} produk dari indeks")
+                    yield previous_rows
+                    continue
+            
+            # Parse HTML
+            card_count, page_products = parse_product_page(content, parser, typed=typed, columnar=columnar)
+            
+            if not card_count:
+                print(f"Tidak ada produk ditemukan di halaman {page_number}")
+                if page_number > 1:  # Jangan berhenti di halaman pertama
+                    print("Kemungkinan sudah mencapai halaman terakhir")
+                    break
+                continue
+            
+            print(f"Ditemukan {card_count} produk di halaman {page_number}")
+            
+            if page_index is not None:
+                page_index.update(
+                    url, digest, page_products.to_dict() if buffer_class else page_products, key=index_key
+                )
+            
+            if page_products:
+                yield page_products
+    finally:
+        pages.close()
+        if owns_session:
+            session.close()
+        if page_index is not None:
+            page_index.save()
+        if cache is not None:
+            cache.flush()
+
+def scrape_fashion_products(base_url, max_pages=50, delay=2, concurrency=1, requests_per_second=None,
+                            session=None, timeout=DEFAULT_TIMEOUT, cache=None, page_index=None,
+                            parser=DEFAULT_PARSER, discover_pages=False, typed=False, columnar=False):
+    """
+    Fungsi utama untuk mengambil data produk fashion dari semua halaman.
+    
+    Args:
+        base_url (str): URL dasar website
+        max_pages (int): Jumlah maksimum halaman yang akan di-scrape
+        delay (int): Delay antar request dalam detik (hanya untuk mode sekuensial)
+        concurrency (int): Jumlah halaman yang diambil bersamaan, 1 berarti sekuensial
+        requests_per_second (float): Batas request per detik untuk mode konkuren
+        session (requests.Session): Session HTTP, default session baru dengan pool sebesar concurrency
+        timeout (float | tuple): Timeout setiap request dalam detik
+        cache (PageCache): Cache halaman untuk conditional GET, opsional
+        page_index (PageIndex): Indeks hash halaman untuk melewati parsing halaman yang tidak berubah
+        parser (str): Backend parser HTML ("html.parser", "lxml", "selectolax", atau "auto")
+        discover_pages (bool): Tentukan jumlah halaman lebih dulu dengan discover_page_count
+        typed (bool): Ekstrak langsung ke kolom bertipe (ProductColumns)
+        columnar (bool): Kumpulkan data ke buffer per kolom (ProductRecords) alih-alih list dict
         
-        print(f"Ditemukan {len(collection_cards)} produk di halaman {page_number}")
+    Returns:
+        list | ProductRecords: Data semua produk sesuai urutan halaman
+    """
+    buffer_class = _record_buffer_class(typed, columnar)
+    data = buffer_class() if buffer_class else []
+    
+    batches = iter_product_batches(
+        base_url,
+        max_pages=max_pages,
+        delay=delay,
+        concurrency=concurrency,
+        requests_per_second=requests_per_second,
+        session=session,
+        timeout=timeout,
+        cache=cache,
+        page_index=page_index,
+        parser=parser,
+        discover_pages=discover_pages,
+        typed=typed,
+        columnar=columnar
+    )
+    for page_products in batches:
+        data.extend(page_products)
+    
+    return data
+
+def _init_crawl_worker():
+    """Inisialisasi proses worker: jangan memakai ulang koneksi milik proses induk."""
+    global _session
+    _session = None
+
+def _fetch_and_parse_page(url, parser, timeout):
+    """
+    Mengambil dan mem-parse satu halaman di proses worker.
+    
+    Returns:
+        tuple: (jumlah kartu produk, list data produk), (0, []) jika gagal diambil
+    """
+    content = fetching_content(url, timeout=timeout)
+    if not content:
+        return 0, []
+    return parse_product_page(content, parser)
+
+def crawl_catalogues(base_urls, max_pages=50, processes=None, parser=DEFAULT_PARSER,
+                     max_in_flight_per_host=DEFAULT_MAX_IN_FLIGHT_PER_HOST,
+                     host_interval=DEFAULT_HOST_INTERVAL, timeout=DEFAULT_TIMEOUT, discover_pages=False):
+    """
+    Mengambil data produk dari beberapa katalog dengan proses worker.
+    
+    Semua halaman dimasukkan ke UrlFrontier lalu dibagikan ke process pool,
+    setiap worker menjalankan fetch dan parse sehingga parsing HTML yang
+    CPU-bound berjalan paralel di luar GIL. Ketika sebuah katalog mencapai
+    halaman kosong, halaman berikutnya dari katalog itu dihapus dari antrian.
+    Hasil digabungkan secara deterministik berdasarkan urutan katalog lalu
+    urutan halaman.
+    
+    Args:
+        base_urls (list): URL dasar setiap katalog
+        max_pages (int): Jumlah maksimum halaman per katalog
+        processes (int): Jumlah proses worker, default jumlah CPU
+        parser (str): Backend parser HTML
+        max_in_flight_per_host (int): Jumlah maksimum request berjalan per host
+        host_interval (float): Jarak minimal antar request ke host yang sama dalam detik
+        timeout (float | tuple): Timeout setiap request dalam detik
+        discover_pages (bool): Tentukan jumlah halaman setiap katalog sebelum dijadwalkan
         
-        # Ekstrak data dari setiap produk
-        for card in collection_cards:
-            product_data = extract_product_data(card)
-            if product_data:
-                data.append(product_data)
+    Returns:
+        list: List data produk semua katalog
+    """
+    parser = resolve_parser(parser)
+    frontier = UrlFrontier(max_in_flight=max_in_flight_per_host, min_interval=host_interval)
+    results = {}
+    last_page = {}
+    for site_index, base_url in enumerate(base_urls):
+        if discover_pages:
+            page_count = discover_page_count(base_url, max_pages, timeout=timeout, parser=parser)
+        else:
+            page_count = max_pages
+        last_page[site_index] = page_count
+        for page_number, url in enumerate(build_page_urls(base_url, page_count), 1):
+            frontier.add((site_index, page_number), url)
+    
+    processes = processes or os.cpu_count() or 1
+    max_pending = processes * 2
+    
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_crawl_worker) as executor:
+        pending = {}
         
-        # Delay untuk menghindari overload server
-        if page_number < len(urls):
-            time.sleep(delay)
+        while len(frontier) or pending:
+            # Isi pool selama ada host yang siap dan worker belum penuh
+            while len(pending) < max_pending:
+                item = frontier.pop_ready()
+                if item is None:
+                    break
+                key, url = item
+                pending[executor.submit(_fetch_and_parse_page, url, parser, timeout)] = (key, url)
+            
+            if not pending:
+                time.sleep(frontier.wait_time() or 0)
+                continue
+            
+            # Bangun lebih awal jika ada host yang siap dan pool belum penuh
+            wake_up = frontier.wait_time() if len(pending) < max_pending else None
+            finished, _ = wait(pending, timeout=wake_up, return_when=FIRST_COMPLETED)
+            for future in finished:
+                (site_index, page_number), url = pending.pop(future)
+                frontier.done(url)
+                
+                try:
+                    card_count, products = future.result()
+                except Exception as e:
+                    print(f"Error saat memproses {url}: {e}")
+                    card_count, products = 0, []
+                
+                results[(site_index, page_number)] = products
+                print(f"Katalog {site_index + 1} halaman {page_number}: {card_count} produk")
+                
+                # Halaman kosong menandai akhir katalog (kecuali halaman pertama)
+                if not card_count and 1 < page_number < last_page[site_index]:
+                    last_page[site_index] = page_number
+                    frontier.discard(
+                        lambda key, site=site_index, end=page_number: key[0] == site and key[1] > end
+                    )
     
+    # Gabungkan hasil sesuai urutan katalog dan halaman
+    data = []
+    for site_index in range(len(base_urls)):
+        for page_number in range(1, last_page[site_index] + 1):
+            data.extend(results.get((site_index, page_number), []))
+    
+    print(f"Berhasil mengambil {len(data)} produk dari {len(base_urls)} katalog")
     return data
 
-def main():
+def main(cache=None, page_index=None, typed=False):
     """
     Fungsi utama untuk menjalankan proses ekstraksi data.
     
+    Args:
+        cache (PageCache): Cache halaman untuk conditional GET, opsional
+        page_index (PageIndex): Indeks hash halaman untuk ekstraksi inkremental, opsional
+        typed (bool): Hasilkan kolom bertipe sehingga transform_data melewati regex
+        
     Returns:
         pd.DataFrame: DataFrame berisi data produk fashion
     """
     try:
-        base_url = "https://fashion-studio.dicoding.dev"
-        products = scrape_fashion_products(base_url, max_pages=50)
+        products = scrape_fashion_products(
+            BASE_URL,
+            max_pages=MAX_PAGES,
+            concurrency=DEFAULT_CONCURRENCY,
+            requests_per_second=DEFAULT_REQUESTS_PER_SECOND,
+            cache=cache,
+            page_index=page_index,
+            parser="auto",
+            discover_pages=True,
+            typed=typed,
+            columnar=True
+        )
         
-        if not products:
+        if not len(products):
             print("Tidak ada data yang berhasil diekstrak")
             return None
         
-        df = pd.DataFrame(products)
+        if isinstance(products, ProductRecords):
+            df = products.to_frame()
+        else:
+            df = pd.DataFrame(products)
         print(f"Berhasil mengekstrak {len(df)} produk")
         return df
     
@@ -162,5 +1267,32 @@ def main():
         print(f"Error pada proses ekstraksi: {e}")
         return None
 
+def stream_main(cache=None, page_index=None, typed=False):
+    """
+    Versi streaming dari main() yang menghasilkan DataFrame per halaman.
+    
+    Args:
+        cache (PageCache): Cache halaman untuk conditional GET, opsional
+        page_index (PageIndex): Indeks hash halaman untuk ekstraksi inkremental, opsional
+        typed (bool): Hasilkan kolom bertipe sehingga transform_data melewati regex
+        
+    Yields:
+        pd.DataFrame: DataFrame berisi data produk dari satu halaman
+    """
+    batches = iter_product_batches(
+        BASE_URL,
+        max_pages=MAX_PAGES,
+        concurrency=DEFAULT_CONCURRENCY,
+        requests_per_second=DEFAULT_REQUESTS_PER_SECOND,
+        cache=cache,
+        page_index=page_index,
+        parser="auto",
+        discover_pages=True,
+        typed=typed,
+        columnar=True
+    )
+    for page_products in batches:
+        yield page_products.to_frame()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,10 +1,166 @@
 import pandas as pd
+import io
 import os
-from sqlalchemy import create_engine, text
+import gzip
+import json
+import stat
+import time
+import shutil
+import tempfile
+import atexit
+import threading
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.pool import Pool
+from sqlalchemy.types import Text
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+# Konfigurasi pool koneksi default untuk engine di registry
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_PRE_PING = True
+DEFAULT_POOL_RECYCLE = 1800
+
+# Registry engine per URL database beserta metrik pool-nya
+_engines = {}
+_engine_metrics = {}
+_engines_lock = threading.Lock()
+
+class PoolMetrics:
+    """
+    Metrik pemakaian pool koneksi sebuah engine.
+    
+    checkouts/checkins dihitung dari event pool SQLAlchemy, connections
+    adalah jumlah koneksi DBAPI baru yang dibuka, dan waktu tunggu diukur
+    saat pipeline mengambil koneksi dari pool.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connections = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+    
+    def _increment(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+    
+    def record_wait(self, seconds):
+        """Mencatat lama menunggu satu koneksi dari pool."""
+        with self._lock:
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+    
+    def stats(self):
+        """Mengambil metrik dalam bentuk dictionary."""
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connections": self.connections,
+                "wait_seconds": self.wait_seconds,
+                "max_wait_seconds": self.max_wait_seconds,
+            }
+
+def get_engine(db_url, pool_size=DEFAULT_POOL_SIZE, max_overflow=DEFAULT_MAX_OVERFLOW,
+               pool_pre_ping=DEFAULT_POOL_PRE_PING, pool_recycle=DEFAULT_POOL_RECYCLE, echo=False):
+    """
+    Mengambil engine untuk sebuah URL database dari registry.
+    
+    Engine dibuat sekali per URL lalu dipakai ulang oleh setiap run pipeline
+    dalam proses yang sama, sehingga pool koneksinya juga dipakai ulang.
+    Konfigurasi pool hanya berlaku saat engine pertama kali dibuat.
+    
+    Args:
+        db_url (str): URL koneksi database
+        pool_size (int): Jumlah koneksi yang dipertahankan di pool
+        max_overflow (int): Koneksi tambahan di atas pool_size saat sibuk
+        pool_pre_ping (bool): Uji koneksi sebelum dipakai agar koneksi putus diganti
+        pool_recycle (int): Umur maksimum koneksi dalam detik
+        echo (bool): Tampilkan setiap statement SQL (untuk debugging)
+        
+    Returns:
+        sqlalchemy.engine.Engine: Engine yang di-cache
+    """
+    with _engines_lock:
+        engine = _engines.get(db_url)
+        if engine is None:
+            options = {"pool_pre_ping": pool_pre_ping, "pool_recycle": pool_recycle}
+            # Pool SQLite tidak selalu menerima pool_size/max_overflow
+            if not db_url.startswith("sqlite"):
+                options.update(pool_size=pool_size, max_overflow=max_overflow)
+            
+            engine = create_engine(db_url, echo=echo, **options)
+            metrics = PoolMetrics()
+            if isinstance(getattr(engine, "pool", None), Pool):
+                event.listen(engine.pool, "checkout", lambda *args: metrics._increment("checkouts"))
+                event.listen(engine.pool, "checkin", lambda *args: metrics._increment("checkins"))
+                event.listen(engine.pool, "connect", lambda *args: metrics._increment("connections"))
+            
+            _engines[db_url] = engine
+            _engine_metrics[db_url] = metrics
+        
+        engine.echo = echo
+        return engine
+
+@contextmanager
+def _begin(engine, db_url):
+    """
+    Membuka transaksi pada engine sambil mencatat waktu tunggu koneksi.
+    
+    Args:
+        engine (sqlalchemy.engine.Engine): Engine dari get_engine
+        db_url (str): URL yang menjadi kunci metrik engine
+        
+    Yields:
+        sqlalchemy.engine.Connection: Koneksi dalam transaksi
+    """
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        metrics = _engine_metrics.get(db_url)
+        if metrics is not None:
+            metrics.record_wait(time.perf_counter() - start)
+        yield conn
+
+def pool_metrics(db_url):
+    """
+    Mengambil metrik pool koneksi untuk sebuah URL database.
+    
+    Args:
+        db_url (str): URL koneksi database
+        
+    Returns:
+        dict: Metrik PoolMetrics ditambah jumlah koneksi yang sedang dipakai,
+            atau None jika engine untuk URL tersebut belum dibuat
+    """
+    with _engines_lock:
+        engine = _engines.get(db_url)
+        metrics = _engine_metrics.get(db_url)
+    if engine is None:
+        return None
+    
+    stats = metrics.stats()
+    checkedout = getattr(engine.pool, "checkedout", None)
+    stats["checked_out"] = checkedout() if callable(checkedout) else 0
+    return stats
+
+def dispose_engines():
+    """Menutup semua pool koneksi dan mengosongkan registry engine."""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+        _engine_metrics.clear()
+    for engine in engines:
+        engine.dispose()
+
+atexit.register(dispose_engines)
+
 def prepare_dataframe_for_sql(df):
     """
     Mempersiapkan DataFrame untuk disimpan ke SQL.
@@ -18,8 +174,24 @@ def prepare_dataframe_for_sql(df):
     try:
         df_copy = df.copy()
         
+        # Kolom datetime tetap datetime agar tersimpan sebagai TIMESTAMP (NaT menjadi NULL)
+        native_cols = [
+            col for col in df_copy.columns
+            if pd.api.types.is_datetime64_any_dtype(df_copy[col])
+        ]
+        
+        # Kolom category tetap category, nilai kosong diganti '' seperti kolom teks
+        for col in df_copy.columns:
+            if isinstance(df_copy[col].dtype, pd.CategoricalDtype):
+                native_cols.append(col)
+                if df_copy[col].isna().any():
+                    if '' not in df_copy[col].cat.categories:
+                        df_copy[col] = df_copy[col].cat.add_categories('')
+                    df_copy[col] = df_copy[col].fillna('')
+        
         # Tangani NaN dengan lebih baik
-        df_copy = df_copy.fillna('')
+        other_cols = [col for col in df_copy.columns if col not in native_cols]
+        df_copy[other_cols] = df_copy[other_cols].fillna('')
         
         # Konversi tipe data yang mungkin bermasalah dengan lebih spesifik
         for col in df_copy.columns:
@@ -31,6 +203,11 @@ def prepare_dataframe_for_sql(df):
             elif pd.api.types.is_numeric_dtype(df_copy[col]):
                 # Konversi NaN ke 0 untuk kolom numerik
                 df_copy[col] = df_copy[col].fillna(0)
+                
+                # float32 (skema compact) dikirim sebagai float64 dari desimal terpendeknya,
+                # agar 4.1 tersimpan sebagai 4.1 dan bukan 4.099999904632568
+                if df_copy[col].dtype == 'float32':
+                    df_copy[col] = df_copy[col].astype(str).astype('float64')
         
         # Hapus karakter yang mungkin menyebabkan masalah SQL
         for col in df_copy.select_dtypes(['object']).columns:
@@ -43,19 +220,198 @@ def prepare_dataframe_for_sql(df):
         traceback.print_exc()
         return df
 
-def save_to_csv(df, file_path="products.csv"):
+def _sheet_values(df):
+    """
+    Mengonversi baris DataFrame menjadi list nilai yang dapat dikirim ke Sheets API.
+    
+    Kolom datetime diformat sebagai teks, category menjadi nilainya, dan
+    float32 dibulatkan ke representasi desimal terpendeknya (4.8, bukan
+    4.800000190734863).
+    
+    Args:
+        df (pd.DataFrame): DataFrame sumber
+        
+    Returns:
+        list: List baris, setiap baris berupa list nilai
+    """
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            series = series.dt.strftime("%Y-%m-%d %H:%M:%S")
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(object)
+        elif series.dtype == 'float32':
+            series = series.astype(str).astype(float)
+        columns[col] = series
+    return pd.DataFrame(columns).values.tolist()
+
+# Kompresi CSV yang didukung AtomicCsvWriter ("none" berarti teks biasa)
+CSV_COMPRESSIONS = ("none", "gzip", "zstd")
+
+# Jumlah baris per potongan to_csv agar buffer teks tidak sebesar seluruh DataFrame
+DEFAULT_CSV_CHUNKSIZE = 50_000
+
+# Umask proses dibaca sekali saat import (os.umask hanya bisa dibaca dengan menyetelnya)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _open_csv_reader(file_path, compression):
+    """Membuka file CSV lama sebagai stream byte yang sudah didekompresi."""
+    if compression == "gzip":
+        return gzip.open(file_path, "rb")
+    if compression == "zstd":
+        import zstandard
+        raw = open(file_path, "rb")
+        return zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+    return open(file_path, "rb")
+
+class AtomicCsvWriter:
+    """
+    Penulis CSV bertahap yang mengganti file tujuan secara atomik.
+    
+    Potongan data ditulis ke file sementara di direktori yang sama (opsional
+    dikompresi gzip/zstd). Saat commit, file di-fsync lalu di-rename ke path
+    tujuan dengan os.replace, sehingga pembaca hanya pernah melihat file lama
+    yang utuh atau file baru yang utuh, tidak pernah file yang terpotong.
+    
+    Dipakai sebagai context manager: commit jika blok selesai tanpa error,
+    abort (file sementara dihapus, file lama tetap) jika terjadi error.
+    
+    Args:
+        file_path (str): Path file CSV tujuan
+        compression (str): "none", "gzip", atau "zstd" (membutuhkan zstandard)
+        append (bool): Salin isi file lama lebih dulu lalu tambahkan baris baru tanpa header.
+            Seluruh file lama ikut ditulis ulang setiap kali, sehingga biayanya
+            sebanding dengan ukuran file, bukan jumlah baris baru
+        chunksize (int): Jumlah baris per potongan to_csv
+    """
+    
+    def __init__(self, file_path, compression="none", append=False, chunksize=DEFAULT_CSV_CHUNKSIZE):
+        if compression not in CSV_COMPRESSIONS:
+            raise ValueError(f"Kompresi tidak dikenal: {compression}. Pilihan: {', '.join(CSV_COMPRESSIONS)}")
+        
+        self.file_path = file_path
+        self.compression = compression
+        self.chunksize = chunksize
+        self.rows = 0
+        self._header_written = False
+        
+        directory = os.path.dirname(os.path.abspath(file_path))
+        fd, self.temp_path = tempfile.mkstemp(
+            prefix=f".{os.path.basename(file_path)}.", suffix=".tmp", dir=directory
+        )
+        self._raw = os.fdopen(fd, "wb")
+        try:
+            if compression == "gzip":
+                self._stream = gzip.GzipFile(fileobj=self._raw, mode="wb")
+            elif compression == "zstd":
+                import zstandard
+                self._stream = zstandard.ZstdCompressor().stream_writer(self._raw, closefd=False)
+            else:
+                self._stream = self._raw
+            
+            if append and os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+                with _open_csv_reader(file_path, compression) as existing:
+                    shutil.copyfileobj(existing, self._stream)
+                self._header_written = True
+            
+            self._text = io.TextIOWrapper(self._stream, encoding="utf-8", newline="")
+        except Exception:
+            self._raw.close()
+            os.remove(self.temp_path)
+            raise
+    
+    def write(self, df):
+        """
+        Menulis DataFrame ke file sementara per potongan baris.
+        
+        Args:
+            df (pd.DataFrame): DataFrame yang akan ditambahkan
+        """
+        for start in range(0, max(len(df), 1), self.chunksize):
+            df.iloc[start:start + self.chunksize].to_csv(
+                self._text, index=False, header=not self._header_written
+            )
+            self._header_written = True
+        self.rows += len(df)
+    
+    def _close(self):
+        """Menutup stream teks dan kompresi tanpa menutup file mentah."""
+        self._text.flush()
+        self._text.detach()
+        if self._stream is not self._raw:
+            self._stream.close()
+    
+    def commit(self):
+        """Menyimpan file sementara ke disk (fsync) dan mengganti file tujuan secara atomik."""
+        try:
+            self._close()
+            self._raw.flush()
+            os.fsync(self._raw.fileno())
+        finally:
+            self._raw.close()
+        
+        # mkstemp membuat file 0600, samakan dengan izin file lama atau izin open() biasa (0666 & ~umask)
+        if os.path.exists(self.file_path):
+            mode = stat.S_IMODE(os.stat(self.file_path).st_mode)
+        else:
+            mode = 0o666 & ~_UMASK
+        os.chmod(self.temp_path, mode)
+        os.replace(self.temp_path, self.file_path)
+        
+        # fsync direktori agar rename ikut bertahan setelah crash (tidak tersedia di Windows)
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(os.path.dirname(os.path.abspath(self.file_path)), os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+    
+    def abort(self):
+        """Membatalkan penulisan, file sementara dihapus dan file tujuan tidak berubah."""
+        try:
+            self._close()
+        except Exception:
+            pass
+        self._raw.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+def save_to_csv(df, file_path="products.csv", append=False, atomic=False, compression="none"):
     """
     Menyimpan DataFrame ke file CSV.
     
     Args:
         df (pd.DataFrame): DataFrame yang akan disimpan
         file_path (str): Path file CSV tujuan
+        append (bool): Tambahkan baris ke file yang sudah ada tanpa header
+        atomic (bool): Tulis lewat AtomicCsvWriter sehingga file tidak pernah terpotong.
+            Jika digabung dengan append, file lama disalin dan ditulis ulang
+            seluruhnya pada setiap pemanggilan
+        compression (str): "none", "gzip", atau "zstd"; selain "none" selalu atomik
         
     Returns:
         bool: True jika berhasil, False jika gagal
     """
     try:
-        df.to_csv(file_path, index=False)
+        if atomic or compression != "none":
+            with AtomicCsvWriter(file_path, compression=compression, append=append) as writer:
+                writer.write(df)
+        elif append:
+            df.to_csv(file_path, mode='a', header=False, index=False)
+        else:
+            df.to_csv(file_path, index=False)
         print(f"Data berhasil disimpan ke {file_path}")
         return True
     
@@ -65,22 +421,530 @@ def save_to_csv(df, file_path="products.csv"):
         traceback.print_exc()
         return False
 
-def save_to_postgresql(df, db_url):
+# Format file kolumnar dan kompresi yang didukung masing-masing ("none" berarti tanpa kompresi)
+COLUMNAR_FORMATS = ("parquet", "feather")
+COLUMNAR_COMPRESSIONS = {
+    "parquet": ("zstd", "snappy", "gzip", "brotli", "lz4", "none"),
+    "feather": ("zstd", "lz4", "none"),
+}
+DEFAULT_COLUMNAR_COMPRESSION = "zstd"
+
+# Jumlah baris per row group (Parquet) atau record batch (Feather)
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+# Dataset kolumnar dipartisi per tanggal run dengan direktori gaya Hive: run_date=YYYY-MM-DD
+PARTITION_COLUMN = "run_date"
+COLUMNAR_DATASET_PATH = "products_dataset"
+
+def _run_dates(df):
+    """Tanggal run (YYYY-MM-DD) per baris dari kolom timestamp, hari ini jika tidak tersedia."""
+    today = pd.Timestamp.now().strftime("%Y-%m-%d")
+    if "timestamp" not in df.columns:
+        return pd.Series(today, index=df.index)
+    timestamps = pd.to_datetime(df["timestamp"], errors="coerce")
+    return timestamps.dt.strftime("%Y-%m-%d").fillna(today)
+
+def _write_columnar_file(df, file_path, file_format, compression, row_group_size):
+    """
+    Menulis satu DataFrame ke satu file Parquet atau Feather (Arrow IPC).
+    
+    Args:
+        df (pd.DataFrame): DataFrame yang akan disimpan
+        file_path (str): Path file tujuan
+        file_format (str): "parquet" atau "feather"
+        compression (str): Nama kompresi, "none" untuk tanpa kompresi
+        row_group_size (int): Jumlah baris per row group / record batch
+    """
+    # pyarrow opsional, hanya dibutuhkan saat sink kolumnar dipakai
+    import pyarrow as pa
+    
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(
+            table, file_path,
+            compression=None if compression == "none" else compression,
+            row_group_size=row_group_size
+        )
+    else:
+        import pyarrow.feather as feather
+        feather.write_feather(
+            table, file_path,
+            compression="uncompressed" if compression == "none" else compression,
+            chunksize=row_group_size
+        )
+
+def save_to_parquet(df, file_path="products.parquet", file_format="parquet",
+                    compression=DEFAULT_COLUMNAR_COMPRESSION, row_group_size=DEFAULT_ROW_GROUP_SIZE,
+                    partition_by_date=False, append=False):
+    """
+    Menyimpan DataFrame ke format kolumnar Parquet atau Feather (Arrow IPC).
+    
+    Berbeda dengan CSV, tipe data kolom ikut tersimpan dan pembaca dapat
+    memilih kolom atau memfilter row group tanpa membaca seluruh file.
+    Dengan partition_by_date, file_path adalah direktori dataset dan setiap
+    tanggal run ditulis ke run_date=YYYY-MM-DD/part-NNNNN.<format>.
+    
+    Args:
+        df (pd.DataFrame): DataFrame yang akan disimpan
+        file_path (str): Path file, atau direktori dataset jika dipartisi
+        file_format (str): "parquet" atau "feather"
+        compression (str): Kompresi sesuai COLUMNAR_COMPRESSIONS
+        row_group_size (int): Jumlah baris per row group / record batch
+        partition_by_date (bool): Tulis sebagai dataset yang dipartisi per tanggal run
+        append (bool): Tambahkan file part baru; tanpa append partisi tanggal
+            yang ditulis diganti. Hanya didukung untuk dataset yang dipartisi
+        
+    Returns:
+        bool: True jika berhasil, False jika gagal
+    """
+    try:
+        if file_format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Format tidak dikenal: {file_format}. Pilihan: {', '.join(COLUMNAR_FORMATS)}")
+        if compression not in COLUMNAR_COMPRESSIONS[file_format]:
+            raise ValueError(
+                f"Kompresi {compression} tidak didukung untuk {file_format}. "
+                f"Pilihan: {', '.join(COLUMNAR_COMPRESSIONS[file_format])}"
+            )
+        
+        if not partition_by_date:
+            if append:
+                raise ValueError("Mode append hanya didukung untuk dataset yang dipartisi per tanggal")
+            _write_columnar_file(df, file_path, file_format, compression, row_group_size)
+            print(f"Data berhasil disimpan ke {file_path}")
+            return True
+        
+        for run_date, part_df in df.groupby(_run_dates(df), sort=True):
+            partition_dir = os.path.join(file_path, f"{PARTITION_COLUMN}={run_date}")
+            os.makedirs(partition_dir, exist_ok=True)
+            
+            parts = sorted(
+                name for name in os.listdir(partition_dir)
+                if name.startswith("part-") and name.endswith(f".{file_format}")
+            )
+            if not append:
+                for name in parts:
+                    os.remove(os.path.join(partition_dir, name))
+                parts = []
+            
+            part_number = int(parts[-1][5:10]) + 1 if parts else 0
+            part_path = os.path.join(partition_dir, f"part-{part_number:05d}.{file_format}")
+            _write_columnar_file(part_df, part_path, file_format, compression, row_group_size)
+        
+        print(f"Data berhasil disimpan ke dataset {file_path}")
+        return True
+    
+    except Exception as e:
+        print(f"Error saat menyimpan ke {file_format}: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+# Direktori snapshot harian dan nama file manifest di dalamnya
+DEFAULT_SNAPSHOT_DIR = "snapshots"
+SNAPSHOT_MANIFEST = "manifest.json"
+SNAPSHOT_FORMATS = ("csv", "parquet")
+
+def _snapshot_order(entry):
+    """Kunci urutan snapshot menurut waktu yang diwakilinya, bukan urutan penyimpanannya."""
+    return entry["run_date"], entry["created_at"]
+
+class SnapshotStore:
+    """
+    Penyimpanan snapshot append-only yang dipartisi per tanggal run.
+    
+    Setiap run ditulis ke root/run_date=YYYY-MM-DD/<run_id>-part-NNNNN.<format>
+    dan dicatat di manifest.json (run_id, tanggal, file, jumlah baris). Snapshot
+    lama tidak pernah ditimpa, sehingga riwayat data tetap tersedia. Query
+    "terbaru" dan "per tanggal" cukup membaca manifest lalu membuka file milik
+    satu snapshot saja, tanpa memindai seluruh direktori.
+    
+    Args:
+        root (str): Direktori snapshot
+        file_format (str): "csv" atau "parquet" (membutuhkan pyarrow)
+    """
+    
+    def __init__(self, root=DEFAULT_SNAPSHOT_DIR, file_format="csv"):
+        if file_format not in SNAPSHOT_FORMATS:
+            raise ValueError(f"Format tidak dikenal: {file_format}. Pilihan: {', '.join(SNAPSHOT_FORMATS)}")
+        
+        self.root = root
+        self.file_format = file_format
+        self.manifest_path = os.path.join(root, SNAPSHOT_MANIFEST)
+        self._snapshots = []
+        self._lock = threading.Lock()
+        
+        # Snapshot yang dibuat oleh instance ini, satu-satunya tujuan append
+        self.run_id = None
+        
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, encoding="utf-8") as f:
+                    self._snapshots = json.load(f)["snapshots"]
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Manifest snapshot {self.manifest_path} tidak dapat dibaca, mulai dengan manifest kosong: {e}")
+    
+    def snapshots(self):
+        """
+        Mengambil daftar snapshot dari manifest, urut dari yang terlama.
+        
+        Returns:
+            list: Entri manifest (run_id, run_date, created_at, format, files, rows)
+        """
+        with self._lock:
+            return [dict(entry) for entry in self._snapshots]
+    
+    def _save_manifest(self):
+        """Menyimpan manifest ke disk secara atomik."""
+        temp_path = self.manifest_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"snapshots": self._snapshots}, f, indent=2)
+        os.replace(temp_path, self.manifest_path)
+    
+    def save(self, df, append=False, run_time=None):
+        """
+        Menyimpan DataFrame sebagai snapshot baru atau part tambahan snapshot run ini.
+        
+        Append hanya menambah part ke snapshot yang dibuat oleh instance ini
+        (run_id). Jika snapshot tersebut belum ada, misalnya karena batch
+        pertama gagal disimpan, append gagal agar snapshot run sebelumnya
+        tidak ikut berubah.
+        
+        Args:
+            df (pd.DataFrame): DataFrame yang akan disimpan
+            append (bool): Tambahkan ke snapshot run ini, dipakai untuk batch streaming
+            run_time (datetime): Waktu run, default sekarang
+            
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        try:
+            with self._lock:
+                new_snapshot = not append
+                if append:
+                    entry = next((item for item in self._snapshots if item["run_id"] == self.run_id), None)
+                    if entry is None:
+                        raise ValueError("Belum ada snapshot untuk run ini, batch tidak dapat ditambahkan")
+                else:
+                    run_time = pd.Timestamp(run_time) if run_time is not None else pd.Timestamp.now()
+                    entry = {
+                        "run_id": run_time.strftime("%Y%m%dT%H%M%S%f"),
+                        "run_date": run_time.strftime("%Y-%m-%d"),
+                        "created_at": run_time.isoformat(),
+                        "format": self.file_format,
+                        "files": [],
+                        "rows": 0,
+                    }
+                
+                partition_dir = os.path.join(self.root, f"{PARTITION_COLUMN}={entry['run_date']}")
+                os.makedirs(partition_dir, exist_ok=True)
+                file_name = f"{entry['run_id']}-part-{len(entry['files']):05d}.{entry['format']}"
+                file_path = os.path.join(partition_dir, file_name)
+                
+                # File baru selalu ditulis ke path yang belum ada, snapshot lama tidak tersentuh
+                if entry["format"] == "csv":
+                    df.to_csv(file_path, index=False)
+                else:
+                    _write_columnar_file(
+                        df, file_path, "parquet", DEFAULT_COLUMNAR_COMPRESSION, DEFAULT_ROW_GROUP_SIZE
+                    )
+                
+                entry["files"].append(os.path.relpath(file_path, self.root))
+                entry["rows"] += len(df)
+                if new_snapshot:
+                    self._snapshots.append(entry)
+                    self.run_id = entry["run_id"]
+                self._save_manifest()
+            
+            print(f"Snapshot {entry['run_id']} tersimpan di {partition_dir}")
+            return True
+        
+        except Exception as e:
+            print(f"Error saat menyimpan snapshot: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def _read(self, entry, columns=None):
+        """Membaca semua file milik satu snapshot."""
+        paths = [os.path.join(self.root, name) for name in entry["files"]]
+        if entry["format"] == "csv":
+            frames = [pd.read_csv(path, usecols=columns) for path in paths]
+        else:
+            frames = [pd.read_parquet(path, columns=columns) for path in paths]
+        return pd.concat(frames, ignore_index=True)
+    
+    def latest(self, columns=None):
+        """
+        Membaca snapshot terbaru menurut tanggal run (snapshot back-fill yang
+        disimpan belakangan tidak menggantikan snapshot yang lebih baru).
+        
+        Args:
+            columns (list): Kolom yang dibaca, None untuk semua kolom
+            
+        Returns:
+            pd.DataFrame: Data snapshot terbaru, None jika belum ada snapshot
+        """
+        snapshots = self.snapshots()
+        return self._read(max(snapshots, key=_snapshot_order), columns) if snapshots else None
+    
+    def as_of(self, date, columns=None):
+        """
+        Membaca snapshot terakhir yang diambil pada atau sebelum tanggal tertentu.
+        
+        Args:
+            date (str | datetime): Tanggal acuan, seluruh hari tersebut ikut dihitung
+            columns (list): Kolom yang dibaca, None untuk semua kolom
+            
+        Returns:
+            pd.DataFrame: Data snapshot, None jika tidak ada snapshot sebelum tanggal tersebut
+        """
+        run_date = pd.Timestamp(date).strftime("%Y-%m-%d")
+        candidates = [entry for entry in self.snapshots() if entry["run_date"] <= run_date]
+        return self._read(max(candidates, key=_snapshot_order), columns) if candidates else None
+
+# Cara penulisan baris ke database: COPY FROM STDIN (khusus PostgreSQL) atau INSERT
+POSTGRES_LOAD_METHODS = ("copy", "insert")
+
+def _csv_field(value):
+    """Format satu nilai CSV untuk COPY: teks di-quote, None kosong tanpa quote (NULL)."""
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    return str(value)
+
+class _CsvRowStream:
+    """
+    Objek file baca-saja yang menghasilkan CSV dari iterator baris secara bertahap.
+    
+    Dipakai sebagai sumber COPY FROM STDIN sehingga seluruh data tidak perlu
+    ditulis dulu ke satu buffer besar. Teks selalu di-quote sehingga COPY ... CSV
+    membedakan string kosong ('') dari NULL.
+    
+    Args:
+        rows (iterable): Baris nilai sesuai urutan kolom
+    """
+    
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._pending = ''
+    
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = float('inf')
+        
+        lines = [self._pending]
+        length = len(self._pending)
+        while length < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            line = ','.join(map(_csv_field, row)) + '\n'
+            lines.append(line)
+            length += len(line)
+        
+        data = ''.join(lines)
+        if length <= size:
+            self._pending = ''
+            return data
+        self._pending = data[size:]
+        return data[:size]
+
+def _copy_rows(table, conn, keys, data_iter):
+    """
+    Metode to_sql yang memuat baris dengan COPY FROM STDIN lewat psycopg2.
+    
+    Args:
+        table (pandas.io.sql.SQLTable): Tabel tujuan dari pandas
+        conn (sqlalchemy.engine.Connection): Koneksi aktif
+        keys (list): Nama kolom
+        data_iter (iterable): Baris nilai
+        
+    Returns:
+        int: Jumlah baris yang dimuat
+    """
+    dbapi_connection = conn.connection
+    columns = ', '.join(f'"{key}"' for key in keys)
+    table_name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f'COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT CSV)',
+            _CsvRowStream(data_iter)
+        )
+        return cursor.rowcount
+
+def _resolve_load_method(engine, method):
+    """
+    Menentukan metode to_sql sesuai dialek database.
+    
+    Args:
+        engine (sqlalchemy.engine.Engine | Connection): Engine atau koneksi database
+        method (str): "copy" atau "insert"
+        
+    Returns:
+        callable | None: _copy_rows untuk PostgreSQL, None (INSERT bawaan pandas) untuk lainnya
+    """
+    if method not in POSTGRES_LOAD_METHODS:
+        raise ValueError(f"Metode tidak dikenal: {method}. Pilihan: {', '.join(POSTGRES_LOAD_METHODS)}")
+    
+    if method == "copy":
+        if engine.dialect.name == "postgresql":
+            return _copy_rows
+        print(f"COPY tidak didukung oleh {engine.dialect.name}, memakai INSERT")
+    return None
+
+# Kunci alami produk untuk mode upsert
+UPSERT_KEY_COLUMNS = ("Title", "Size", "Gender")
+
+# Kolom yang selalu berubah setiap run dan tidak menandakan perubahan data
+UPSERT_IGNORED_COLUMNS = ("timestamp",)
+
+def _quote(name):
+    """Nama kolom/tabel dalam tanda kutip ganda."""
+    return f'"{name}"'
+
+def _upsert_prepared(conn, df_prepared, table_name, key_columns, dtype, method):
+    """
+    Meng-upsert DataFrame yang sudah dipersiapkan lewat tabel staging sementara.
+    
+    Baris dimuat ke tabel TEMP (dengan COPY di PostgreSQL), lalu digabung ke
+    tabel tujuan dengan INSERT ... ON CONFLICT DO UPDATE. Baris yang isinya
+    sama (selain timestamp) tidak ditulis ulang, dan tabel beserta indeksnya
+    tidak pernah di-drop.
+    
+    Args:
+        conn (sqlalchemy.engine.Connection): Koneksi dalam satu transaksi
+        df_prepared (pd.DataFrame): Data hasil prepare_dataframe_for_sql
+        table_name (str): Tabel tujuan
+        key_columns (tuple): Kolom kunci alami
+        dtype (dict): Tipe kolom untuk to_sql
+        method (str): "copy" atau "insert"
+        
+    Returns:
+        dict: Jumlah baris inserted, updated, dan unchanged
+    """
+    staging_name = f"{table_name}_staging"
+    
+    # Kunci yang sama dalam satu batch hanya boleh muncul sekali di ON CONFLICT
+    df_prepared = df_prepared.drop_duplicates(subset=list(key_columns), keep='last')
+    
+    table = _quote(table_name)
+    staging = _quote(staging_name)
+    keys = ', '.join(_quote(col) for col in key_columns)
+    columns = ', '.join(_quote(col) for col in df_prepared.columns)
+    value_columns = [col for col in df_prepared.columns if col not in key_columns]
+    compared_columns = [col for col in value_columns if col not in UPSERT_IGNORED_COLUMNS]
+    
+    # Tabel dan indeks unik kunci alami dibuat sekali, run berikutnya dipakai ulang
+    df_prepared.head(0).to_sql(table_name, con=conn, if_exists='append', index=False, dtype=dtype)
+    conn.execute(text(
+        f'CREATE UNIQUE INDEX IF NOT EXISTS {_quote(table_name + "_natural_key")} ON {table} ({keys})'
+    ))
+    
+    conn.execute(text(f'DROP TABLE IF EXISTS {staging}'))
+    conn.execute(text(f'CREATE TEMP TABLE {staging} AS SELECT {columns} FROM {table} WHERE 1 = 0'))
+    df_prepared.to_sql(
+        staging_name, con=conn, if_exists='append', index=False,
+        method=_resolve_load_method(conn, method)
+    )
+    
+    distinct = "IS DISTINCT FROM" if conn.dialect.name == "postgresql" else "IS NOT"
+    key_match = ' AND '.join(f't.{_quote(col)} = s.{_quote(col)}' for col in key_columns)
+    changed = ' OR '.join(f't.{_quote(col)} {distinct} s.{_quote(col)}' for col in compared_columns) or '1 = 0'
+    
+    inserted = conn.execute(text(
+        f'SELECT COUNT(*) FROM {staging} s WHERE NOT EXISTS (SELECT 1 FROM {table} t WHERE {key_match})'
+    )).scalar()
+    updated = conn.execute(text(
+        f'SELECT COUNT(*) FROM {staging} s JOIN {table} t ON {key_match} WHERE {changed}'
+    )).scalar()
+    
+    if value_columns:
+        assignments = ', '.join(f'{_quote(col)} = excluded.{_quote(col)}' for col in value_columns)
+        update_changed = ' OR '.join(
+            f'{table}.{_quote(col)} {distinct} excluded.{_quote(col)}' for col in compared_columns
+        ) or '1 = 0'
+        conflict_action = f'DO UPDATE SET {assignments} WHERE {update_changed}'
+    else:
+        conflict_action = 'DO NOTHING'
+    
+    # WHERE true diperlukan SQLite agar ON CONFLICT tidak dibaca sebagai bagian JOIN
+    conn.execute(text(
+        f'INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging} WHERE true '
+        f'ON CONFLICT ({keys}) {conflict_action}'
+    ))
+    conn.execute(text(f'DROP TABLE {staging}'))
+    
+    return {
+        "inserted": inserted,
+        "updated": updated,
+        "unchanged": len(df_prepared) - inserted - updated,
+    }
+
+def upsert_to_postgresql(df, db_url, table_name='fashion_products', key_columns=UPSERT_KEY_COLUMNS,
+                         method="copy", echo=False):
+    """
+    Memperbarui tabel secara inkremental berdasarkan kunci alami produk.
+    
+    Args:
+        df (pd.DataFrame): DataFrame yang akan disimpan
+        db_url (str): URL koneksi database PostgreSQL
+        table_name (str): Tabel tujuan
+        key_columns (tuple): Kolom kunci alami, default Title+Size+Gender
+        method (str): "copy" atau "insert" untuk memuat tabel staging
+        echo (bool): Tampilkan setiap statement SQL (untuk debugging)
+        
+    Returns:
+        dict: Jumlah baris inserted/updated/unchanged, atau None jika gagal
+    """
+    try:
+        engine = get_engine(db_url, echo=echo)
+        df_prepared = prepare_dataframe_for_sql(df)
+        dtype_dict = {col: Text() for col in df_prepared.select_dtypes(['object']).columns}
+        
+        with _begin(engine, db_url) as conn:
+            counts = _upsert_prepared(conn, df_prepared, table_name, tuple(key_columns), dtype_dict, method)
+        
+        print(
+            f"Upsert {table_name} selesai: {counts['inserted']} baru, "
+            f"{counts['updated']} diperbarui, {counts['unchanged']} tidak berubah"
+        )
+        return counts
+    
+    except Exception as e:
+        print(f"Error saat upsert ke database: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+def save_to_postgresql(df, db_url, if_exists='replace', method="copy", echo=False):
     """
     Menyimpan DataFrame ke database PostgreSQL.
     
+    Secara default baris dimuat dengan COPY FROM STDIN, jauh lebih cepat
+    daripada INSERT per batch. Database selain PostgreSQL memakai INSERT.
+    
     Args:
         df (pd.DataFrame): DataFrame yang akan disimpan
         db_url (str): URL koneksi database PostgreSQL
+        if_exists (str): 'replace' untuk menimpa tabel, 'append' untuk menambah baris,
+            'upsert' untuk memperbarui baris berdasarkan kunci alami (lihat upsert_to_postgresql)
+        method (str): "copy" atau "insert"
+        echo (bool): Tampilkan setiap statement SQL (untuk debugging)
         
     Returns:
         bool: True jika berhasil, False jika gagal
     """
+    if if_exists == 'upsert':
+        return upsert_to_postgresql(df, db_url, method=method, echo=echo) is not None
+    
     try:
         print(f"Mencoba koneksi ke database dengan URL: {db_url}")
         
-        # Tambahkan parameter echo=True untuk debugging
-        engine = create_engine(db_url, echo=True)
+        # Engine dan pool koneksi dipakai ulang antar run dalam proses yang sama
+        engine = get_engine(db_url, echo=echo)
         
         # Persiapkan DataFrame untuk SQL
         df_prepared = prepare_dataframe_for_sql(df)
@@ -89,17 +953,19 @@ def save_to_postgresql(df, db_url):
         
         try:
             # Tentukan tipe data untuk kolom objek
-            dtype_dict = {col: 'TEXT' for col in df_prepared.select_dtypes(['object']).columns}
+            dtype_dict = {col: Text() for col in df_prepared.select_dtypes(['object']).columns}
             
             # Simpan data ke tabel - TANPA parameter schema
-            df_prepared.to_sql(
-                'fashion_products', 
-                con=engine, 
-                if_exists='replace', 
-                index=False,
-                dtype=dtype_dict
-                # Hapus parameter schema=xxx
-            )
+            with _begin(engine, db_url) as conn:
+                df_prepared.to_sql(
+                    'fashion_products', 
+                    con=conn, 
+                    if_exists=if_exists, 
+                    index=False,
+                    dtype=dtype_dict,
+                    method=_resolve_load_method(engine, method)
+                    # Hapus parameter schema=xxx
+                )
             
             print("Data berhasil disimpan ke PostgreSQL dalam schema public")
             return True
@@ -116,7 +982,342 @@ def save_to_postgresql(df, db_url):
         traceback.print_exc()
         return False
 
-def save_to_google_sheets(df, credentials_path, spreadsheet_id):
+# Nama sheet tujuan dan batas ukuran payload satu request batchUpdate
+SHEET_NAME = 'Sheet1'
+SHEETS_MAX_REQUEST_BYTES = 2 * 1024 * 1024
+
+# Jumlah baris maksimum per request update/append
+SHEETS_MAX_ROWS_PER_REQUEST = 5000
+
+# Kuota tulis Sheets API per menit per user, dengan burst kecil agar jendela per menit tidak terlampaui
+SHEETS_WRITE_REQUESTS_PER_MINUTE = 60
+SHEETS_BURST = 10
+
+# Retry untuk error kuota (429) dan layanan tidak tersedia (503)
+SHEETS_MAX_RETRIES = 5
+SHEETS_BACKOFF_FACTOR = 1.0
+SHEETS_MAX_RETRY_DELAY = 120
+SHEETS_RETRY_STATUS_CODES = (429, 503)
+
+class TokenBucket:
+    """
+    Token bucket thread-safe untuk membatasi laju request ke API.
+    
+    Setiap acquire memesan satu token. Jika token habis, pemanggil tidur
+    sampai token yang dipesannya terisi kembali.
+    
+    Args:
+        requests_per_minute (float): Laju pengisian token per menit
+        capacity (int): Jumlah token maksimum (burst)
+    """
+    
+    def __init__(self, requests_per_minute=SHEETS_WRITE_REQUESTS_PER_MINUTE, capacity=SHEETS_BURST):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """
+        Mengambil satu token, menunggu jika perlu.
+        
+        Returns:
+            float: Lama menunggu dalam detik
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+# Kuota tulis berlaku per proyek/user, sehingga bucket dipakai bersama semua pemanggilan
+_sheets_bucket = TokenBucket()
+
+# Service Sheets API per file kredensial, discovery cukup dijalankan sekali
+_sheets_services = {}
+_sheets_services_lock = threading.Lock()
+
+def get_sheets_service(credentials_path):
+    """
+    Mengambil service Google Sheets API untuk sebuah file kredensial.
+    
+    Args:
+        credentials_path (str): Path ke file credentials Google Sheets API
+        
+    Returns:
+        Objek service Sheets API yang di-cache
+    """
+    with _sheets_services_lock:
+        service = _sheets_services.get(credentials_path)
+        if service is None:
+            # Memuat kredensial
+            credentials = service_account.Credentials.from_service_account_file(
+                credentials_path, 
+                scopes=['https://www.googleapis.com/auth/spreadsheets']
+            )
+            
+            # Membuat service
+            service = build('sheets', 'v4', credentials=credentials)
+            _sheets_services[credentials_path] = service
+        return service
+
+def clear_sheets_services():
+    """Menghapus cache service Sheets API (misalnya setelah kredensial diganti)."""
+    with _sheets_services_lock:
+        _sheets_services.clear()
+
+def _retry_after_seconds(value):
+    """
+    Mengubah header Retry-After (detik atau HTTP-date) menjadi lama menunggu.
+    
+    Args:
+        value (str): Nilai header, None jika tidak ada
+        
+    Returns:
+        float: Lama menunggu dalam detik, None jika header kosong atau tidak valid
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        return None
+    return max((retry_at - pd.Timestamp.now(tz="UTC").to_pydatetime()).total_seconds(), 0.0)
+
+def _execute_sheets_request(request, bucket=None, max_retries=SHEETS_MAX_RETRIES,
+                            backoff_factor=SHEETS_BACKOFF_FACTOR):
+    """
+    Menjalankan request Sheets API dengan token bucket dan retry.
+    
+    Error 429/503 diulang dengan exponential backoff (atau sesuai header
+    Retry-After jika ada, dalam detik maupun HTTP-date), dengan jeda paling
+    lama SHEETS_MAX_RETRY_DELAY detik. Error lain langsung diteruskan.
+    
+    Args:
+        request: Request Sheets API yang belum dijalankan
+        bucket (TokenBucket): Pembatas laju, None untuk request baca tanpa kuota tulis
+        max_retries (int): Jumlah pengulangan maksimum
+        backoff_factor (float): Faktor backoff dalam detik
+        
+    Returns:
+        dict: Respons API
+    """
+    for attempt in range(max_retries + 1):
+        if bucket is not None:
+            bucket.acquire()
+        try:
+            return request.execute()
+        except HttpError as e:
+            status = getattr(e.resp, 'status', None)
+            if status not in SHEETS_RETRY_STATUS_CODES or attempt == max_retries:
+                raise
+            
+            retry_after = e.resp.get('retry-after') if hasattr(e.resp, 'get') else None
+            delay = _retry_after_seconds(retry_after)
+            if delay is None:
+                delay = backoff_factor * (2 ** attempt)
+            delay = min(delay, SHEETS_MAX_RETRY_DELAY)
+            print(f"Sheets API membalas {status}, mencoba lagi dalam {delay:.1f} detik")
+            time.sleep(delay)
+
+def _column_letter(index):
+    """Huruf kolom A1 untuk indeks kolom berbasis 1 (1 -> A, 27 -> AA)."""
+    letters = ''
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+def _normalize_cell(value):
+    """Bentuk teks sel untuk perbandingan, 400000.0 dan 400000 dianggap sama."""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+def _changed_row_ranges(old_rows, new_rows, ignored_columns=()):
+    """
+    Mencari kelompok baris berurutan yang berbeda antara isi sheet dan data baru.
+    
+    Baris lama yang tidak ada lagi di data baru dikosongkan, dan sel di luar
+    lebar data baru ikut ditimpa string kosong. Baris data yang hanya berbeda
+    di kolom ignored_columns (dicari dari header baru) dianggap tidak berubah.
+    
+    Args:
+        old_rows (list): Nilai sheet saat ini (baris bisa lebih pendek karena sel kosong)
+        new_rows (list): Nilai baru termasuk header
+        ignored_columns (tuple): Nama kolom yang tidak dibandingkan pada baris data
+        
+    Returns:
+        list: Pasangan (indeks baris awal berbasis 0, list baris) untuk setiap kelompok
+    """
+    width = max([len(row) for row in old_rows] + [len(row) for row in new_rows] + [1])
+    header = list(new_rows[0]) if new_rows else []
+    ignored = {index for index, name in enumerate(header) if name in ignored_columns}
+    
+    def padded(row, skip=()):
+        cells = [_normalize_cell(value) for value in row] + [''] * (width - len(row))
+        return [cell for index, cell in enumerate(cells) if index not in skip]
+    
+    ranges = []
+    for index in range(max(len(old_rows), len(new_rows))):
+        new_row = new_rows[index] if index < len(new_rows) else []
+        old_row = old_rows[index] if index < len(old_rows) else []
+        # Header dibandingkan utuh, baris kosong (dihapus) tetap harus ditulis
+        skip = ignored if index > 0 and new_row else ()
+        if padded(new_row, skip) == padded(old_row, skip):
+            continue
+        
+        row = list(new_row) + [''] * (width - len(new_row))
+        if ranges and ranges[-1][0] + len(ranges[-1][1]) == index:
+            ranges[-1][1].append(row)
+        else:
+            ranges.append((index, [row]))
+    return ranges
+
+def _value_range_requests(ranges, max_bytes=SHEETS_MAX_REQUEST_BYTES):
+    """
+    Menyusun body batchUpdate yang masing-masing di bawah batas ukuran payload.
+    
+    Kelompok baris yang terlalu besar dipecah menjadi beberapa range.
+    
+    Args:
+        ranges (list): Hasil _changed_row_ranges
+        max_bytes (int): Perkiraan ukuran JSON maksimum per request
+        
+    Returns:
+        list: List berisi list data range ({'range', 'values'}) per request
+    """
+    requests_data = []
+    current, current_bytes = [], 0
+    
+    for start, rows in ranges:
+        piece, piece_start = [], start
+        for offset, row in enumerate(rows):
+            row_bytes = len(json.dumps(row, default=str))
+            
+            # Request penuh: tutup range yang sedang disusun dan mulai request baru
+            if current_bytes + row_bytes > max_bytes and (current or piece):
+                if piece:
+                    current.append(_value_range(piece_start, piece))
+                requests_data.append(current)
+                current, current_bytes = [], 0
+                piece, piece_start = [], start + offset
+            
+            piece.append(row)
+            current_bytes += row_bytes
+        current.append(_value_range(piece_start, piece))
+    
+    if current:
+        requests_data.append(current)
+    return requests_data
+
+def _value_range(start, rows):
+    """Data satu range A1 untuk baris berurutan mulai dari indeks start (berbasis 0)."""
+    end_column = _column_letter(len(rows[0]))
+    return {
+        'range': f"{SHEET_NAME}!A{start + 1}:{end_column}{start + len(rows)}",
+        'values': rows,
+    }
+
+def _write_sheet_delta(service, spreadsheet_id, values, max_bytes=SHEETS_MAX_REQUEST_BYTES, bucket=None,
+                       ignored_columns=UPSERT_IGNORED_COLUMNS):
+    """
+    Menulis hanya baris yang berubah ke sheet dengan values().batchUpdate.
+    
+    Isi sheet dibaca sekali, dibandingkan dengan data baru, lalu kelompok
+    baris yang berbeda dikirim dalam request yang ukurannya dibatasi.
+    Seperti upsert, baris yang hanya berbeda timestamp tidak ditulis ulang.
+    
+    Args:
+        service: Objek service Google Sheets API
+        spreadsheet_id (str): ID spreadsheet
+        values (list): Nilai baru termasuk header
+        max_bytes (int): Perkiraan ukuran JSON maksimum per request
+        bucket (TokenBucket): Pembatas laju request tulis
+        ignored_columns (tuple): Kolom yang tidak dibandingkan, () untuk membandingkan semua kolom
+        
+    Returns:
+        tuple: (jumlah baris yang ditulis, jumlah request batchUpdate)
+    """
+    sheet_values = service.spreadsheets().values()
+    existing = _execute_sheets_request(sheet_values.get(
+        spreadsheetId=spreadsheet_id,
+        range=SHEET_NAME,
+        valueRenderOption='UNFORMATTED_VALUE'
+    )).get('values', [])
+    
+    ranges = _changed_row_ranges(existing, values, ignored_columns)
+    requests_data = _value_range_requests(ranges, max_bytes)
+    for data in requests_data:
+        _execute_sheets_request(sheet_values.batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={'valueInputOption': 'RAW', 'data': data}
+        ), bucket)
+    
+    return sum(len(rows) for _, rows in ranges), len(requests_data)
+
+def _write_sheet_chunks(service, spreadsheet_id, values, append=False,
+                        max_rows=SHEETS_MAX_ROWS_PER_REQUEST, bucket=None):
+    """
+    Menulis nilai ke sheet dalam potongan baris berukuran terbatas.
+    
+    Setiap potongan dikirim berurutan lewat token bucket dan retry, sehingga
+    data besar tidak gagal karena payload terlalu besar atau kuota per menit.
+    
+    Args:
+        service: Objek service Google Sheets API
+        spreadsheet_id (str): ID spreadsheet
+        values (list): Nilai yang akan ditulis
+        append (bool): Tambahkan setelah data yang ada alih-alih menimpa dari A1
+        max_rows (int): Jumlah baris maksimum per request
+        bucket (TokenBucket): Pembatas laju request tulis
+        
+    Returns:
+        int: Jumlah sel yang diperbarui
+    """
+    sheet_values = service.spreadsheets().values()
+    updated_cells = 0
+    
+    for start in range(0, len(values), max_rows):
+        body = {
+            'values': values[start:start + max_rows]
+        }
+        
+        if append:
+            result = _execute_sheets_request(sheet_values.append(
+                spreadsheetId=spreadsheet_id,
+                range=f'{SHEET_NAME}!A1',
+                valueInputOption='RAW',
+                insertDataOption='INSERT_ROWS',
+                body=body
+            ), bucket)
+            updated_cells += result.get('updates', {}).get('updatedCells') or 0
+        else:
+            result = _execute_sheets_request(sheet_values.update(
+                spreadsheetId=spreadsheet_id,
+                range=f'{SHEET_NAME}!A{start + 1}',
+                valueInputOption='RAW',
+                body=body
+            ), bucket)
+            updated_cells += result.get('updatedCells') or 0
+    
+    return updated_cells
+
+def save_to_google_sheets(df, credentials_path, spreadsheet_id, append=False, delta=False):
     """
     Menyimpan DataFrame ke Google Sheets.
     
@@ -124,37 +1325,45 @@ def save_to_google_sheets(df, credentials_path, spreadsheet_id):
         df (pd.DataFrame): DataFrame yang akan disimpan
         credentials_path (str): Path ke file credentials Google Sheets API
         spreadsheet_id (str): ID spreadsheet Google Sheets
+        append (bool): Tambahkan baris setelah data yang sudah ada tanpa header
+        delta (bool): Baca sheet lalu tulis hanya baris yang berubah (diabaikan saat append)
         
     Returns:
         bool: True jika berhasil, False jika gagal
     """
     try:
-        # Memuat kredensial
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_path, 
-            scopes=['https://www.googleapis.com/auth/spreadsheets']
-        )
-        
-        # Membuat service
-        service = build('sheets', 'v4', credentials=credentials)
+        # Service di-cache per file kredensial
+        service = get_sheets_service(credentials_path)
         
         # Konversi DataFrame ke list values
-        values = [df.columns.tolist()]  # Header
-        values.extend(df.values.tolist())  # Data
+        values = [] if append else [df.columns.tolist()]  # Header
+        values.extend(_sheet_values(df))  # Data
         
         # Mengirim data ke Google Sheets
-        body = {
-            'values': values
-        }
+        if delta and not append:
+            changed_rows, request_count = _write_sheet_delta(
+                service, spreadsheet_id, values, bucket=_sheets_bucket
+            )
+            print(
+                f"Data berhasil disimpan ke Google Sheets, {changed_rows} baris berubah "
+                f"dikirim dalam {request_count} request"
+            )
+            return True
         
-        result = service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range='Sheet1!A1',
-            valueInputOption='RAW',
-            body=body
-        ).execute()
+        updated_cells = _write_sheet_chunks(
+            service, spreadsheet_id, values, append=append, bucket=_sheets_bucket
+        )
+        
+        # Penulisan penuh menggantikan tabel lama: baris lama di bawah data baru dikosongkan,
+        # sehingga batch streaming berikutnya (append) langsung menyambung setelah data baru
+        if not append:
+            _execute_sheets_request(service.spreadsheets().values().clear(
+                spreadsheetId=spreadsheet_id,
+                range=f'{SHEET_NAME}!A{len(values) + 1}:ZZZ',
+                body={}
+            ), _sheets_bucket)
         
-        print(f"Data berhasil disimpan ke Google Sheets, {result.get('updatedCells')} sel diperbarui")
+        print(f"Data berhasil disimpan ke Google Sheets, {updated_cells} sel diperbarui")
         return True
     
     except HttpError as e:
@@ -169,8 +1378,71 @@ def save_to_google_sheets(df, credentials_path, spreadsheet_id):
         traceback.print_exc()
         return False
 
+def _timed_sink(save):
+    """
+    Menjalankan satu repositori dan mengukur lamanya.
+    
+    Args:
+        save (callable): Fungsi tanpa argumen yang menyimpan data
+        
+    Returns:
+        tuple: (status, durasi dalam detik)
+    """
+    start = time.perf_counter()
+    status = save()
+    return status, time.perf_counter() - start
+
+def _run_sinks(sinks, concurrent=False, timeout=None):
+    """
+    Menjalankan penyimpanan ke beberapa repositori, berurutan atau paralel.
+    
+    Pada mode paralel setiap repositori berjalan di thread sendiri sehingga
+    repositori yang lambat tidak menahan yang lain. Repositori yang melewati
+    timeout atau melempar error dianggap gagal; thread-nya dibiarkan selesai
+    di latar belakang karena thread tidak dapat dihentikan paksa.
+    
+    Args:
+        sinks (dict): Nama repositori -> fungsi tanpa argumen yang menyimpan data
+        concurrent (bool): Jalankan repositori secara paralel
+        timeout (float): Batas waktu per repositori dalam detik, None tanpa batas
+        
+    Returns:
+        tuple: (dict status, dict durasi dalam detik) per repositori
+    """
+    status = {}
+    timings = {}
+    
+    if not concurrent or len(sinks) < 2:
+        for name, save in sinks.items():
+            status[name], timings[name] = _timed_sink(save)
+        return status, timings
+    
+    executor = ThreadPoolExecutor(max_workers=len(sinks), thread_name_prefix="load-sink")
+    try:
+        start = time.perf_counter()
+        futures = {name: executor.submit(_timed_sink, save) for name, save in sinks.items()}
+        
+        for name, future in futures.items():
+            # Timeout dihitung sejak semua repositori mulai berjalan bersamaan
+            remaining = None if timeout is None else max(0.0, timeout - (time.perf_counter() - start))
+            try:
+                status[name], timings[name] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                print(f"Penyimpanan ke {name} melewati batas waktu {timeout} detik")
+                status[name], timings[name] = False, time.perf_counter() - start
+            except Exception as e:
+                print(f"Error pada penyimpanan ke {name}: {e}")
+                status[name], timings[name] = False, time.perf_counter() - start
+    finally:
+        executor.shutdown(wait=False)
+    
+    return status, timings
+
 def load_data(df, save_csv=True, save_postgres=False, save_gsheets=False, 
-              db_url=None, credentials_path=None, spreadsheet_id=None):
+              db_url=None, credentials_path=None, spreadsheet_id=None, append=False,
+              postgres_mode=None, gsheets_delta=False, concurrent=False, sink_timeout=None,
+              save_columnar=False, columnar_path=COLUMNAR_DATASET_PATH, columnar_format="parquet",
+              snapshot_store=None, csv_atomic=False):
     """
     Menyimpan data ke berbagai repositori.
     
@@ -182,55 +1454,90 @@ def load_data(df, save_csv=True, save_postgres=False, save_gsheets=False,
         db_url (str): URL koneksi database PostgreSQL
         credentials_path (str): Path ke file credentials Google Sheets API
         spreadsheet_id (str): ID spreadsheet Google Sheets
+        append (bool): Tambahkan data ke setiap repositori, dipakai untuk batch streaming
+        postgres_mode (str): 'replace', 'append', atau 'upsert'; default mengikuti append
+        gsheets_delta (bool): Tulis hanya baris yang berubah ke Google Sheets
+        concurrent (bool): Simpan ke semua repositori secara paralel
+        sink_timeout (float): Batas waktu per repositori dalam detik pada mode paralel
+        save_columnar (bool): Flag untuk menyimpan ke dataset kolumnar yang dipartisi per tanggal run
+        columnar_path (str): Direktori dataset kolumnar
+        columnar_format (str): "parquet" atau "feather"
+        snapshot_store (SnapshotStore): Simpan juga sebagai snapshot harian yang tidak ditimpa
+        csv_atomic (bool): Tulis CSV ke file sementara lalu ganti file tujuan secara atomik
         
     Returns:
-        dict: Status penyimpanan untuk setiap repositori
+        dict: Status penyimpanan untuk setiap repositori, ditambah durasi
+            per repositori di kunci "timings"
     """
+    failed = {"csv": False, "postgres": False, "gsheets": False}
+    if save_columnar:
+        failed["columnar"] = False
+    if snapshot_store is not None:
+        failed["snapshot"] = False
+    
     try:
         if df is None or df.empty:
             print("DataFrame kosong atau None, tidak dapat melakukan penyimpanan")
-            return {"csv": False, "postgres": False, "gsheets": False}
+            return dict(failed)
         
         print("Memulai proses penyimpanan data...")
-        result = {}
+        result = dict(failed)
+        sinks = {}
         
         # Simpan ke CSV
-        if save_csv:
-            result["csv"] = save_to_csv(df)
-        else:
-            result["csv"] = False
+        if save_csv and csv_atomic:
+            sinks["csv"] = lambda: save_to_csv(df, append=append, atomic=True)
+        elif save_csv:
+            sinks["csv"] = lambda: save_to_csv(df, append=append)
         
         # Simpan ke PostgreSQL
         if save_postgres and db_url:
             print(f"Menyimpan ke PostgreSQL dengan URL: {db_url}")
-            result["postgres"] = save_to_postgresql(df, db_url)
-        else:
-            result["postgres"] = False
-            if save_postgres and not db_url:
-                print("URL database tidak disediakan untuk PostgreSQL")
+            if_exists = postgres_mode or ('append' if append else 'replace')
+            sinks["postgres"] = lambda: save_to_postgresql(df, db_url, if_exists=if_exists)
+        elif save_postgres:
+            print("URL database tidak disediakan untuk PostgreSQL")
         
         # Simpan ke Google Sheets
         if save_gsheets and credentials_path and spreadsheet_id:
             if os.path.exists(credentials_path):
-                result["gsheets"] = save_to_google_sheets(df, credentials_path, spreadsheet_id)
+                if gsheets_delta:
+                    sinks["gsheets"] = lambda: save_to_google_sheets(
+                        df, credentials_path, spreadsheet_id, append=append, delta=True
+                    )
+                else:
+                    sinks["gsheets"] = lambda: save_to_google_sheets(
+                        df, credentials_path, spreadsheet_id, append=append
+                    )
             else:
                 print(f"File kredensial {credentials_path} tidak ditemukan")
-                result["gsheets"] = False
-        else:
-            result["gsheets"] = False
-            if save_gsheets:
-                if not credentials_path:
-                    print("Path kredensial tidak disediakan untuk Google Sheets")
-                if not spreadsheet_id:
-                    print("ID spreadsheet tidak disediakan untuk Google Sheets")
+        elif save_gsheets:
+            if not credentials_path:
+                print("Path kredensial tidak disediakan untuk Google Sheets")
+            if not spreadsheet_id:
+                print("ID spreadsheet tidak disediakan untuk Google Sheets")
+        
+        # Simpan ke dataset kolumnar
+        if save_columnar:
+            sinks["columnar"] = lambda: save_to_parquet(
+                df, columnar_path, file_format=columnar_format,
+                partition_by_date=True, append=append
+            )
+        
+        # Simpan ke snapshot harian
+        if snapshot_store is not None:
+            sinks["snapshot"] = lambda: snapshot_store.save(df, append=append)
         
+        status, timings = _run_sinks(sinks, concurrent=concurrent, timeout=sink_timeout)
+        result.update(status)
+        result["timings"] = timings
         return result
     
     except Exception as e:
         print(f"Error pada proses penyimpanan data: {e}")
         import traceback
         traceback.print_exc()
-        return {"csv": False, "postgres": False, "gsheets": False}
+        return dict(failed)
 
 if __name__ == "__main__":
     # Test dengan DataFrame dummy
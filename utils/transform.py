@@ -1,25 +1,203 @@
 import pandas as pd
 import re
+import json
 import numpy as np
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-def clean_price(df):
+# Engine transformasi yang tersedia untuk transform_data
+TRANSFORM_ENGINES = ("python", "vectorized")
+
+# Skema tipe data hasil transformasi: "default" (string) atau "compact" (category/datetime/int8/float32)
+SCHEMAS = ("default", "compact")
+COMPACT_DTYPES = {
+    "Title": "string",
+    "Price_in_rupiah": "float64",
+    "Rating": "float32",
+    "Size": "category",
+    "Gender": "category",
+}
+
+# Kurs default USD ke Rupiah
+DEFAULT_USD_TO_IDR = 16000
+
+class RateProvider:
+    """
+    Dasar penyedia kurs mata uang ke Rupiah dengan cache memoisasi.
+    
+    Setiap pasangan (tanggal, mata uang) hanya dicari sekali ke sumber kurs,
+    pencarian berikutnya diambil dari cache di memori proses.
+    Subclass mengimplementasikan _lookup dan menandai by_date=True bila kurs
+    bergantung pada tanggal baris.
+    """
+    
+    by_date = False
+    
+    def __init__(self):
+        self._cache = {}
+        self.lookups = 0
+    
+    def rate(self, date, currency="USD"):
+        """
+        Mengambil kurs mata uang ke Rupiah untuk suatu tanggal.
+        
+        Args:
+            date (pd.Timestamp): Tanggal kurs, diabaikan jika by_date False
+            currency (str): Kode mata uang sumber
+            
+        Returns:
+            float: Nilai 1 unit mata uang dalam Rupiah
+        """
+        key = (date if self.by_date else None, currency)
+        if key not in self._cache:
+            self.lookups += 1
+            self._cache[key] = float(self._lookup(key[0], currency))
+        return self._cache[key]
+    
+    def _lookup(self, date, currency):
+        raise NotImplementedError
+
+class StaticRateProvider(RateProvider):
+    """
+    Kurs tetap untuk setiap tanggal.
+    
+    Args:
+        usd_rate (float): Nilai 1 USD dalam Rupiah
+        rates (dict): Kurs tambahan per kode mata uang
+    """
+    
+    def __init__(self, usd_rate=DEFAULT_USD_TO_IDR, rates=None):
+        super().__init__()
+        self.rates = {"USD": usd_rate, **(rates or {})}
+    
+    def _lookup(self, date, currency):
+        if currency not in self.rates:
+            raise ValueError(f"Kurs untuk mata uang {currency} tidak tersedia")
+        return self.rates[currency]
+
+class FileRateProvider(StaticRateProvider):
+    """
+    Kurs tetap yang dibaca dari file JSON lokal, misalnya {"USD": 16250}.
+    
+    Args:
+        path (str): Path file JSON kurs per kode mata uang
+    """
+    
+    def __init__(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            rates = json.load(f)
+        super().__init__(usd_rate=rates.pop("USD", DEFAULT_USD_TO_IDR), rates=rates)
+
+class RateTableProvider(RateProvider):
+    """
+    Kurs historis dari tabel (date, currency, rate).
+    
+    Kurs yang dipakai adalah kurs terakhir pada atau sebelum tanggal baris.
+    Tanggal sebelum awal tabel memakai kurs paling awal, dan baris tanpa
+    timestamp memakai kurs terbaru.
+    
+    Args:
+        table (pd.DataFrame | str): DataFrame atau path CSV dengan kolom date, currency, rate
+    """
+    
+    by_date = True
+    
+    def __init__(self, table):
+        super().__init__()
+        if not isinstance(table, pd.DataFrame):
+            table = pd.read_csv(table)
+        table = table.assign(date=pd.to_datetime(table['date']).dt.normalize())
+        self._series = {
+            currency: group.set_index('date')['rate'].astype(float).sort_index()
+            for currency, group in table.groupby('currency')
+        }
+    
+    def _lookup(self, date, currency):
+        if currency not in self._series:
+            raise ValueError(f"Kurs untuk mata uang {currency} tidak tersedia")
+        
+        series = self._series[currency]
+        if date is None or pd.isna(date):
+            return series.iloc[-1]
+        
+        position = series.index.searchsorted(date, side='right') - 1
+        return series.iloc[max(position, 0)]
+
+DEFAULT_RATE_PROVIDER = StaticRateProvider()
+
+def _row_rates(df_clean, mask, rate_provider, currency="USD"):
+    """
+    Menyusun kolom kurs untuk baris harga yang valid.
+    
+    Kurs dicari sekali per tanggal unik, lalu dipetakan ke setiap baris.
+    
+    Args:
+        df_clean (pd.DataFrame): DataFrame yang sedang dibersihkan
+        mask (pd.Series): Baris dengan harga valid
+        rate_provider (RateProvider): Penyedia kurs
+        currency (str): Kode mata uang harga
+        
+    Returns:
+        float | np.ndarray: Kurs tunggal, atau array kurs per baris valid
+    """
+    if not rate_provider.by_date or 'timestamp' not in df_clean.columns:
+        return rate_provider.rate(None, currency)
+    
+    codes, uniques = pd.factorize(df_clean.loc[mask, 'timestamp'], use_na_sentinel=False)
+    dates = pd.to_datetime(pd.Series(uniques, dtype=object), errors='coerce').dt.normalize()
+    unique_rates = np.array([rate_provider.rate(date, currency) for date in dates], dtype=float)
+    return unique_rates.take(codes)
+
+def is_typed_frame(df):
+    """
+    Mengecek apakah DataFrame berasal dari jalur ekstraksi bertipe.
+    
+    Hasil ProductColumns.to_frame sudah berisi angka pada Price (USD),
+    Rating, dan Colors, sehingga regex pembersihan tidak perlu dijalankan.
+    
+    Args:
+        df (pd.DataFrame): DataFrame mentah hasil ekstraksi
+        
+    Returns:
+        bool: True jika kolom Price, Rating, dan Colors sudah numerik
+    """
+    return all(
+        col in df.columns and pd.api.types.is_numeric_dtype(df[col])
+        for col in ('Price', 'Rating', 'Colors')
+    )
+
+def clean_price(df, inplace=False, rate_provider=None):
     """
     Membersihkan dan mengonversi kolom Price dari USD ke Rupiah.
     
+    Kolom Price boleh berupa teks ("$12.50") atau angka USD dari jalur
+    ekstraksi bertipe.
+    
     Args:
         df (pd.DataFrame): DataFrame yang akan dibersihkan
+        inplace (bool): Ubah df secara langsung tanpa membuat salinan
+        rate_provider (RateProvider): Penyedia kurs, default kurs tetap 16000
         
     Returns:
         pd.DataFrame: DataFrame dengan kolom Price yang sudah dibersihkan
     """
     try:
-        df_clean = df.copy()
+        df_clean = df if inplace else df.copy()
+        rate_provider = rate_provider or DEFAULT_RATE_PROVIDER
         
-        # Filter baris dengan harga yang valid (mengandung $)
-        mask = df_clean['Price'].str.contains(r'\$', na=False)
+        if pd.api.types.is_numeric_dtype(df_clean['Price']):
+            # Harga sudah berupa angka USD, NaN berarti tidak tersedia
+            mask = df_clean['Price'].notna()
+            amounts = df_clean.loc[mask, 'Price'].astype(float)
+        else:
+            # Filter baris dengan harga yang valid (mengandung $)
+            mask = df_clean['Price'].str.contains(r'\$', na=False)
+            
+            # Ekstrak angka dari string harga
+            amounts = df_clean.loc[mask, 'Price'].str.extract(r'\$(\d+\.?\d*)')[0].astype(float)
         
-        # Ekstrak angka dari string harga dan konversi ke Rupiah
-        df_clean.loc[mask, 'Price_in_rupiah'] = df_clean.loc[mask, 'Price'].str.extract(r'\$(\d+\.?\d*)')[0].astype(float) * 16000
+        # Konversi ke Rupiah
+        df_clean.loc[mask, 'Price_in_rupiah'] = amounts * _row_rates(df_clean, mask, rate_provider)
         
         # Baris dengan harga tidak valid akan diberi NaN
         df_clean.loc[~mask, 'Price_in_rupiah'] = float('nan')
@@ -30,18 +208,19 @@ def clean_price(df):
         print(f"Error saat membersihkan kolom Price: {e}")
         raise
 
-def clean_rating(df):
+def clean_rating(df, inplace=False):
     """
     Membersihkan kolom Rating menjadi nilai float.
     
     Args:
         df (pd.DataFrame): DataFrame yang akan dibersihkan
+        inplace (bool): Ubah df secara langsung tanpa membuat salinan
         
     Returns:
         pd.DataFrame: DataFrame dengan kolom Rating yang sudah dibersihkan
     """
     try:
-        df_clean = df.copy()
+        df_clean = df if inplace else df.copy()
         
         # Ekstrak nilai numerik dari rating
         df_clean['Rating'] = df_clean['Rating'].apply(
@@ -56,18 +235,19 @@ def clean_rating(df):
         print(f"Error saat membersihkan kolom Rating: {e}")
         raise
 
-def clean_colors(df):
+def clean_colors(df, inplace=False):
     """
     Membersihkan kolom Colors menjadi nilai numerik.
     
     Args:
         df (pd.DataFrame): DataFrame yang akan dibersihkan
+        inplace (bool): Ubah df secara langsung tanpa membuat salinan
         
     Returns:
         pd.DataFrame: DataFrame dengan kolom Colors yang sudah dibersihkan
     """
     try:
-        df_clean = df.copy()
+        df_clean = df if inplace else df.copy()
         
         # Ekstrak angka dari string "X Colors"
         df_clean['Colors'] = df_clean['Colors'].apply(
@@ -82,18 +262,19 @@ def clean_colors(df):
         print(f"Error saat membersihkan kolom Colors: {e}")
         raise
 
-def clean_size(df):
+def clean_size(df, inplace=False):
     """
     Membersihkan kolom Size dengan menghapus "Size: ".
     
     Args:
         df (pd.DataFrame): DataFrame yang akan dibersihkan
+        inplace (bool): Ubah df secara langsung tanpa membuat salinan
         
     Returns:
         pd.DataFrame: DataFrame dengan kolom Size yang sudah dibersihkan
     """
     try:
-        df_clean = df.copy()
+        df_clean = df if inplace else df.copy()
         
         # Hapus "Size: " dari string
         df_clean['Size'] = df_clean['Size'].apply(
@@ -108,18 +289,19 @@ def clean_size(df):
         print(f"Error saat membersihkan kolom Size: {e}")
         raise
 
-def clean_gender(df):
+def clean_gender(df, inplace=False):
     """
     Membersihkan kolom Gender dengan menghapus "Gender: ".
     
     Args:
         df (pd.DataFrame): DataFrame yang akan dibersihkan
+        inplace (bool): Ubah df secara langsung tanpa membuat salinan
         
     Returns:
         pd.DataFrame: DataFrame dengan kolom Gender yang sudah dibersihkan
     """
     try:
-        df_clean = df.copy()
+        df_clean = df if inplace else df.copy()
         
         # Hapus "Gender: " dari string
         df_clean['Gender'] = df_clean['Gender'].apply(
@@ -134,46 +316,200 @@ def clean_gender(df):
         print(f"Error saat membersihkan kolom Gender: {e}")
         raise
 
-def remove_invalid_data(df):
+# Hasil infer_dtype yang diterima accessor .str pandas
+_STR_ACCESSOR_TYPES = ("string", "empty", "bytes", "mixed", "mixed-integer")
+
+def _string_values(series):
     """
-    Menghapus data yang tidak valid dari DataFrame.
+    Mengembalikan series sebagai object agar accessor .str dapat dipakai.
+    
+    Tipe non-numerik (object, category, string, string[pyarrow]) dikonversi
+    ke object apa adanya. Kolom tanpa nilai string sama sekali (numerik atau
+    seluruhnya NaN) diubah menjadi series NaN bertipe object, sama seperti
+    baris non-string pada implementasi per-baris.
+    """
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return pd.Series(np.nan, index=series.index, dtype=object)
+    values = series if series.dtype == object else series.astype(object)
+    if pd.api.types.infer_dtype(values, skipna=True) not in _STR_ACCESSOR_TYPES:
+        return pd.Series(np.nan, index=series.index, dtype=object)
+    return values
+
+def _transform_unique(series, transform):
+    """
+    Menjalankan transformasi .str hanya pada nilai unik lalu memetakannya
+    kembali ke setiap baris dengan NumPy take.
+    
+    Kolom hasil scraping memiliki sedikit nilai unik (ukuran, gender, rating),
+    sehingga regex cukup dijalankan sekali per nilai unik, bukan per baris.
+    
+    Args:
+        series (pd.Series): Kolom mentah
+        transform (callable): Fungsi Series -> Series yang memakai operasi .str
+        
+    Returns:
+        np.ndarray: Nilai hasil transformasi untuk setiap baris
+    """
+    codes, uniques = pd.factorize(_string_values(series))
+    
+    # Nilai kosong (kode -1) dipetakan ke elemen terakhir, yaitu hasil transformasi NaN
+    candidates = pd.Series(np.append(np.asarray(uniques, dtype=object), np.nan), dtype=object)
+    return transform(candidates).to_numpy()[codes]
+
+def clean_rating_vectorized(df, inplace=False):
+    """
+    Versi vectorized dari clean_rating menggunakan .str.extract.
+    
+    Args:
+        df (pd.DataFrame): DataFrame yang akan dibersihkan
+        inplace (bool): Ubah df secara langsung tanpa membuat salinan
+        
+    Returns:
+        pd.DataFrame: DataFrame dengan kolom Rating yang sudah dibersihkan
+    """
+    try:
+        df_clean = df if inplace else df.copy()
+        
+        # Ekstrak angka pertama dari setiap nilai rating unik
+        df_clean['Rating'] = _transform_unique(
+            df_clean['Rating'],
+            lambda values: values.str.extract(r'([\d.]+)', expand=False).astype(float)
+        )
+        
+        return df_clean
+    
+    except Exception as e:
+        print(f"Error saat membersihkan kolom Rating: {e}")
+        raise
+
+def clean_colors_vectorized(df, inplace=False):
+    """
+    Versi vectorized dari clean_colors menggunakan .str.extract.
     
     Args:
         df (pd.DataFrame): DataFrame yang akan dibersihkan
+        inplace (bool): Ubah df secara langsung tanpa membuat salinan
         
     Returns:
-        pd.DataFrame: DataFrame tanpa data yang tidak valid
+        pd.DataFrame: DataFrame dengan kolom Colors yang sudah dibersihkan
     """
     try:
-        df_clean = df.copy()
+        df_clean = df if inplace else df.copy()
         
-        # Hapus baris dengan title "Unknown Product"
-        df_clean = df_clean[df_clean['Title'] != "Unknown Product"]
+        colors = _transform_unique(
+            df_clean['Colors'],
+            lambda values: values.str.extract(r'(\d+)', expand=False).astype(float)
+        )
         
-        # Hapus baris dengan nilai NaN
-        df_clean = df_clean.dropna()
+        # Sama seperti versi per baris: int jika semua baris valid, float jika ada NaN
+        if not np.isnan(colors).any():
+            colors = colors.astype('int64')
+        df_clean['Colors'] = colors
         
-        # Hapus duplikat
-        df_clean = df_clean.drop_duplicates()
+        return df_clean
+    
+    except Exception as e:
+        print(f"Error saat membersihkan kolom Colors: {e}")
+        raise
+
+def _strip_label(values, label):
+    """Menghapus label dari setiap nilai string, nilai non-string menjadi None."""
+    cleaned = values.str.replace(label, '', regex=False).str.strip()
+    return cleaned.where(cleaned.notna(), None)
+
+def clean_size_vectorized(df, inplace=False):
+    """
+    Versi vectorized dari clean_size menggunakan .str.replace.
+    
+    Args:
+        df (pd.DataFrame): DataFrame yang akan dibersihkan
+        inplace (bool): Ubah df secara langsung tanpa membuat salinan
         
+    Returns:
+        pd.DataFrame: DataFrame dengan kolom Size yang sudah dibersihkan
+    """
+    try:
+        df_clean = df if inplace else df.copy()
+        df_clean['Size'] = _transform_unique(df_clean['Size'], lambda values: _strip_label(values, 'Size:'))
         return df_clean
     
+    except Exception as e:
+        print(f"Error saat membersihkan kolom Size: {e}")
+        raise
+
+def clean_gender_vectorized(df, inplace=False):
+    """
+    Versi vectorized dari clean_gender menggunakan .str.replace.
+    
+    Args:
+        df (pd.DataFrame): DataFrame yang akan dibersihkan
+        inplace (bool): Ubah df secara langsung tanpa membuat salinan
+        
+    Returns:
+        pd.DataFrame: DataFrame dengan kolom Gender yang sudah dibersihkan
+    """
+    try:
+        df_clean = df if inplace else df.copy()
+        df_clean['Gender'] = _transform_unique(df_clean['Gender'], lambda values: _strip_label(values, 'Gender:'))
+        return df_clean
+    
+    except Exception as e:
+        print(f"Error saat membersihkan kolom Gender: {e}")
+        raise
+
+def remove_invalid_data(df):
+    """
+    Menghapus data yang tidak valid dari DataFrame.
+    
+    Args:
+        df (pd.DataFrame): DataFrame yang akan dibersihkan
+        
+    Returns:
+        pd.DataFrame: DataFrame baru tanpa data yang tidak valid
+    """
+    try:
+        # Hapus baris dengan title "Unknown Product" dan baris dengan nilai NaN
+        keep = (df['Title'] != "Unknown Product") & df.notna().all(axis=1)
+        
+        # Hapus duplikat. Baris tidak valid tidak mungkin identik dengan baris
+        # valid, sehingga duplikat bisa dicari di seluruh DataFrame sekaligus
+        keep &= ~df.duplicated()
+        
+        # Satu kali pengambilan baris, hasilnya DataFrame baru milik pemanggil
+        return df.take(np.flatnonzero(keep.to_numpy()))
+    
     except Exception as e:
         print(f"Error saat menghapus data tidak valid: {e}")
         raise
 
-def convert_data_types(df):
+def convert_data_types(df, inplace=False, schema="default"):
     """
     Mengonversi tipe data kolom-kolom dalam DataFrame.
     
+    Skema "compact" memakai category untuk Size/Gender, datetime64 untuk
+    timestamp, serta int8/float32 untuk Colors/Rating.
+    
     Args:
         df (pd.DataFrame): DataFrame yang akan dikonversi tipe datanya
+        inplace (bool): Ubah df secara langsung tanpa membuat salinan
+        schema (str): "default" atau "compact"
         
     Returns:
         pd.DataFrame: DataFrame dengan tipe data yang sudah dikonversi
     """
     try:
-        df_clean = df.copy()
+        if schema not in SCHEMAS:
+            raise ValueError(f"Skema tidak dikenal: {schema}. Pilihan: {', '.join(SCHEMAS)}")
+        
+        df_clean = df if inplace else df.copy()
+        
+        if schema == "compact":
+            for col, dtype in COMPACT_DTYPES.items():
+                df_clean[col] = df_clean[col].astype(dtype)
+            # Tipe integer terkecil yang cukup (int8 untuk jumlah warna biasa)
+            df_clean['Colors'] = pd.to_numeric(df_clean['Colors'].astype(int), downcast='integer')
+            df_clean['timestamp'] = pd.to_datetime(df_clean['timestamp'], format="%Y-%m-%d %H:%M:%S")
+            return df_clean
         
         # Konversi tipe data
         df_clean['Title'] = df_clean['Title'].astype('string')
@@ -190,12 +526,50 @@ def convert_data_types(df):
         print(f"Error saat mengonversi tipe data: {e}")
         raise
 
-def transform_data(df):
+def memory_usage_report(before, after):
+    """
+    Membandingkan pemakaian memori per kolom dua DataFrame.
+    
+    Args:
+        before (pd.DataFrame): DataFrame sebelum konversi
+        after (pd.DataFrame): DataFrame sesudah konversi
+        
+    Returns:
+        pd.DataFrame: Byte sebelum/sesudah, byte yang dihemat, dan persentasenya per kolom
+    """
+    report = pd.DataFrame({
+        "before_bytes": before.memory_usage(index=False, deep=True),
+        "after_bytes": after.memory_usage(index=False, deep=True),
+    })
+    report["dtype_before"] = before.dtypes.astype(str)
+    report["dtype_after"] = after.dtypes.astype(str)
+    report["saved_bytes"] = report["before_bytes"] - report["after_bytes"]
+    report["saved_pct"] = (report["saved_bytes"] / report["before_bytes"] * 100).round(1)
+    return report
+
+def transform_data(df, engine="python", single_copy=True, schema="default", workers=1,
+                   rate_provider=None):
     """
     Melakukan seluruh transformasi data.
     
+    Dengan single_copy=True input disalin sekali di awal, lalu setiap langkah
+    mengubah salinan tersebut secara langsung (inplace). Dengan False setiap
+    langkah membuat salinan sendiri seperti sebelumnya.
+    
+    Input dari jalur ekstraksi bertipe (lihat is_typed_frame) hanya melewati
+    konversi harga, pembersihan Rating/Colors/Size/Gender dilewati.
+    
+    Dengan workers > 1 data dibagi menjadi beberapa partisi baris yang
+    ditransformasi paralel di proses terpisah, lalu digabung dan duplikat
+    lintas partisi dibuang.
+    
     Args:
         df (pd.DataFrame): DataFrame yang akan ditransformasi
+        engine (str): "python" (regex per baris) atau "vectorized" (operasi .str pandas)
+        single_copy (bool): Salin input sekali lalu ubah kolom secara inplace
+        schema (str): Skema tipe data hasil, "default" atau "compact"
+        workers (int): Jumlah proses untuk transformasi paralel
+        rate_provider (RateProvider): Penyedia kurs untuk konversi harga
         
     Returns:
         pd.DataFrame: DataFrame yang sudah ditransformasi
@@ -205,21 +579,43 @@ def transform_data(df):
             print("DataFrame kosong atau None, tidak dapat melakukan transformasi")
             return None
         
+        if engine not in TRANSFORM_ENGINES:
+            raise ValueError(f"Engine tidak dikenal: {engine}. Pilihan: {', '.join(TRANSFORM_ENGINES)}")
+        
+        if workers > 1 and len(df) > 1:
+            return _transform_parallel(df, engine, single_copy, schema, workers, rate_provider)
+        
         print("Memulai transformasi data...")
         
+        # Satu-satunya salinan input, langkah berikutnya bekerja inplace
+        inplace = single_copy
+        if inplace:
+            df = df.copy()
+        
         # Terapkan semua fungsi transformasi
-        df = clean_price(df)
-        df = clean_rating(df)
-        df = clean_colors(df)
-        df = clean_size(df)
-        df = clean_gender(df)
+        typed = is_typed_frame(df)
+        df = clean_price(df, inplace=inplace, rate_provider=rate_provider)
+        # Rating, Colors, Size, dan Gender dari jalur bertipe sudah bersih sejak ekstraksi
+        if not typed and engine == "vectorized":
+            df = clean_rating_vectorized(df, inplace=inplace)
+            df = clean_colors_vectorized(df, inplace=inplace)
+            df = clean_size_vectorized(df, inplace=inplace)
+            df = clean_gender_vectorized(df, inplace=inplace)
+        elif not typed:
+            df = clean_rating(df, inplace=inplace)
+            df = clean_colors(df, inplace=inplace)
+            df = clean_size(df, inplace=inplace)
+            df = clean_gender(df, inplace=inplace)
         df = remove_invalid_data(df)
         
         # Hapus kolom Price asli karena sudah ada Price_in_rupiah
-        df = df.drop(columns=['Price'])
+        if inplace:
+            df.drop(columns=['Price'], inplace=True)
+        else:
+            df = df.drop(columns=['Price'])
         
         # Konversi tipe data
-        df = convert_data_types(df)
+        df = convert_data_types(df, inplace=inplace, schema=schema)
         
         print(f"Transformasi berhasil, jumlah data: {len(df)}")
         return df
@@ -228,6 +624,218 @@ def transform_data(df):
         print(f"Error pada proses transformasi: {e}")
         return None
 
+class RowDeduplicator:
+    """
+    Menghapus baris duplikat lintas chunk menggunakan fingerprint 64-bit.
+    
+    Fingerprint setiap baris (hash_pandas_object) disimpan dalam beberapa
+    array NumPy uint64 terurut, sehingga memori yang dipakai hanya 8 byte per
+    baris unik, tidak bergantung pada lebar baris. Setiap chunk menambah satu
+    array baru; array yang ukurannya berdekatan digabung (seperti LSM tree),
+    sehingga jumlah array tetap logaritmik dan tiap fingerprint hanya ikut
+    digabung O(log n) kali, bukan seluruh himpunan diurutkan ulang per chunk.
+    Peluang tabrakan hash 64-bit dapat diabaikan untuk jumlah baris yang realistis.
+    """
+    
+    def __init__(self):
+        self._runs = []
+    
+    def __len__(self):
+        return sum(len(run) for run in self._runs)
+    
+    def _contains(self, hashes):
+        """Menandai fingerprint yang sudah ada di salah satu array terurut."""
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self._runs:
+            positions = np.searchsorted(run, hashes).clip(max=len(run) - 1)
+            found |= run[positions] == hashes
+        return found
+    
+    def _add_run(self, run):
+        """Menambah array terurut baru lalu menggabung array dengan ukuran berdekatan."""
+        self._runs.append(run)
+        while len(self._runs) > 1 and len(self._runs[-2]) <= 2 * len(self._runs[-1]):
+            newer = self._runs.pop()
+            merged = np.concatenate([self._runs.pop(), newer])
+            # Dua bagian sudah terurut, sort stabil (timsort) cukup menggabungkannya secara linear
+            merged.sort(kind="stable")
+            self._runs.append(merged)
+    
+    def filter(self, df):
+        """
+        Mengambil baris yang belum pernah terlihat di chunk sebelumnya.
+        
+        Args:
+            df (pd.DataFrame): Chunk yang sudah ditransformasi
+            
+        Returns:
+            pd.DataFrame: Baris unik dari chunk, urutan asli dipertahankan
+        """
+        hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        
+        # Fingerprint unik (terurut) beserta posisi kemunculan pertamanya di chunk
+        uniques, first_positions = np.unique(hashes, return_index=True)
+        
+        # Belum pernah terlihat di chunk sebelumnya; query terurut membuat searchsorted ramah cache
+        new = ~self._contains(uniques) if self._runs else np.ones(len(uniques), dtype=bool)
+        if new.any():
+            self._add_run(uniques[new])
+        
+        keep = np.zeros(len(hashes), dtype=bool)
+        keep[first_positions[new]] = True
+        return df.take(np.flatnonzero(keep))
+
+# Input transformasi paralel, diwarisi proses worker lewat fork tanpa pickling
+_parallel_source = None
+
+def _partition_bounds(row_count, partitions):
+    """
+    Membagi rentang baris menjadi partisi berurutan dengan ukuran hampir sama.
+    
+    Args:
+        row_count (int): Jumlah baris data
+        partitions (int): Jumlah partisi
+        
+    Returns:
+        list: Pasangan (awal, akhir) untuk setiap partisi
+    """
+    edges = np.linspace(0, row_count, partitions + 1).astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(edges[:-1], edges[1:]) if stop > start]
+
+def _transform_inherited_partition(start, stop, engine, single_copy, schema, rate_provider):
+    """
+    Mentransformasi satu partisi dari input yang diwarisi lewat fork.
+    
+    Args:
+        start (int): Posisi baris awal partisi
+        stop (int): Posisi baris akhir partisi (eksklusif)
+        engine (str): Engine transformasi
+        single_copy (bool): Salin partisi sekali lalu ubah kolom secara inplace
+        schema (str): Skema tipe data hasil
+        rate_provider (RateProvider): Penyedia kurs untuk konversi harga
+        
+    Returns:
+        pd.DataFrame: Partisi yang sudah ditransformasi
+    """
+    return transform_data(
+        _parallel_source.iloc[start:stop], engine=engine, single_copy=single_copy, schema=schema,
+        rate_provider=rate_provider
+    )
+
+def _transform_partition(partition, engine, single_copy, schema, rate_provider):
+    """
+    Mentransformasi satu partisi yang dikirim ke worker (tanpa fork).
+    
+    Args:
+        partition (pd.DataFrame): Potongan baris data mentah
+        engine (str): Engine transformasi
+        single_copy (bool): Salin partisi sekali lalu ubah kolom secara inplace
+        schema (str): Skema tipe data hasil
+        rate_provider (RateProvider): Penyedia kurs untuk konversi harga
+        
+    Returns:
+        pd.DataFrame: Partisi yang sudah ditransformasi
+    """
+    return transform_data(
+        partition, engine=engine, single_copy=single_copy, schema=schema, rate_provider=rate_provider
+    )
+
+def _transform_parallel(df, engine, single_copy, schema, workers, rate_provider):
+    """
+    Mentransformasi partisi baris secara paralel di ProcessPoolExecutor.
+    
+    Pada platform yang mendukung fork, worker membaca input dari memori yang
+    diwarisi (copy-on-write) sehingga hanya batas partisi yang dikirim. Di
+    platform lain setiap partisi di-pickle ke worker. Hasil digabung sesuai
+    urutan partisi, lalu duplikat lintas partisi dibuang dengan RowDeduplicator.
+    
+    Args:
+        df (pd.DataFrame): DataFrame mentah
+        engine (str): Engine transformasi
+        single_copy (bool): Salin partisi sekali lalu ubah kolom secara inplace
+        schema (str): Skema tipe data hasil
+        workers (int): Jumlah proses worker
+        rate_provider (RateProvider): Penyedia kurs untuk konversi harga
+        
+    Returns:
+        pd.DataFrame: DataFrame yang sudah ditransformasi
+    """
+    global _parallel_source
+    
+    bounds = _partition_bounds(len(df), min(workers, len(df)))
+    print(f"Memulai transformasi paralel: {len(bounds)} partisi, {workers} worker")
+    
+    use_fork = "fork" in multiprocessing.get_all_start_methods()
+    if use_fork:
+        _parallel_source = df
+    
+    try:
+        context = multiprocessing.get_context("fork") if use_fork else None
+        with ProcessPoolExecutor(max_workers=len(bounds), mp_context=context) as executor:
+            if use_fork:
+                futures = [
+                    executor.submit(
+                        _transform_inherited_partition, start, stop, engine, single_copy, schema, rate_provider
+                    )
+                    for start, stop in bounds
+                ]
+            else:
+                futures = [
+                    executor.submit(
+                        _transform_partition, df.iloc[start:stop], engine, single_copy, schema, rate_provider
+                    )
+                    for start, stop in bounds
+                ]
+            partitions = [future.result() for future in futures]
+    finally:
+        _parallel_source = None
+    
+    if any(partition is None for partition in partitions):
+        raise RuntimeError("Transformasi salah satu partisi gagal")
+    
+    deduplicator = RowDeduplicator()
+    result = pd.concat([deduplicator.filter(partition) for partition in partitions])
+    
+    # Kategori tiap partisi bisa berbeda, concat mengembalikannya ke object
+    if schema == "compact":
+        for col, dtype in COMPACT_DTYPES.items():
+            if dtype == "category" and col in result.columns:
+                result[col] = result[col].astype("category")
+    
+    print(f"Transformasi paralel berhasil, jumlah data: {len(result)}")
+    return result
+
+def iter_transform_chunks(source, chunksize=100_000, engine="vectorized", schema="default",
+                          rate_provider=None):
+    """
+    Mentransformasi file CSV mentah per chunk tanpa memuat seluruh isinya.
+    
+    Setiap chunk melewati transform_data, lalu baris yang sudah muncul di
+    chunk sebelumnya dibuang oleh RowDeduplicator. Memori yang dipakai
+    sebanding dengan ukuran chunk ditambah 8 byte per baris unik.
+    
+    Args:
+        source (str): Path atau buffer CSV mentah hasil ekstraksi
+        chunksize (int): Jumlah baris per chunk
+        engine (str): Engine transformasi
+        schema (str): Skema tipe data hasil
+        rate_provider (RateProvider): Penyedia kurs, cache-nya dipakai bersama oleh semua chunk
+        
+    Yields:
+        pd.DataFrame: Chunk yang sudah ditransformasi dan bebas duplikat
+    """
+    deduplicator = RowDeduplicator()
+    
+    for chunk_number, chunk in enumerate(pd.read_csv(source, chunksize=chunksize, dtype=str), 1):
+        print(f"Memproses chunk {chunk_number} ({len(chunk)} baris)")
+        transformed = transform_data(chunk, engine=engine, schema=schema, rate_provider=rate_provider)
+        if transformed is None:
+            continue
+        
+        transformed = deduplicator.filter(transformed)
+        if not transformed.empty:
+            yield transformed
+
 if __name__ == "__main__":
     # Test dengan DataFrame dummy
     data = {